@@ -1,5 +1,7 @@
 import sys
 import os
+import logging
+from logging.handlers import RotatingFileHandler
 
 # expandable_segments reduces fragmentation-induced OOM on Linux.
 # Not supported on the Windows PyTorch build — skip it there to avoid UserWarnings.
@@ -11,7 +13,37 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-from core.q_main_window import launch_qt_app
+
+def setup_logging() -> None:
+    """Attaches a rotating file log to the root logger before any heavy imports run."""
+    log_dir = os.path.join(current_dir, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+
+    handler = RotatingFileHandler(
+        os.path.join(log_dir, "chatterbox_pro.log"),
+        maxBytes=5 * 1024 * 1024,
+        backupCount=3,
+        encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    handler.setLevel(logging.INFO)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(handler)
+
 
 if __name__ == "__main__":
+    setup_logging()
+    # Qt debug chatter would otherwise flood stderr during startup
+    os.environ.setdefault("QT_LOGGING_RULES", "*.debug=false")
+
+    # Imported here (not at module top) so logging is live before torch/PySide6 load,
+    # and so spawned worker processes re-importing this module skip the Qt stack entirely.
+    try:
+        from core.q_main_window import launch_qt_app
+    except ImportError:
+        logging.critical("Failed to import application modules. Check your installed dependencies.", exc_info=True)
+        raise
+
     launch_qt_app()
@@ -80,7 +80,7 @@ class PlaylistModel(QAbstractListModel):
         """"""
         idx = self.index(row_index, 0)
         if idx.isValid():
-            self.dataChanged.emit(idx, idx, [Qt.DisplayRole, self.StatusRole])
+            self.dataChanged.emit(idx, idx, [Qt.DisplayRole, self.StatusRole, self.MarkedRole])
 
     def update_rows(self, row_indices: List[int]):
         """"""
@@ -96,7 +96,7 @@ class PlaylistModel(QAbstractListModel):
         end = self.index(max_idx, 0)
         
         if start.isValid() and end.isValid():
-            self.dataChanged.emit(start, end, [Qt.DisplayRole, self.StatusRole])
+            self.dataChanged.emit(start, end, [Qt.DisplayRole, self.StatusRole, self.MarkedRole])
 
     def get_item(self, row_index: int):
         """Returns the raw data dict for a given row index."""
@@ -1,6 +1,7 @@
 import sys
 from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QTabWidget, QSplitter, QMessageBox
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from PySide6.QtCore import QThread, QTimer
 import torch
 
 from core.state import AppState
@@ -179,10 +180,11 @@ class ChatterboxProQt(QMainWindow):
         # Wire Session Update (Sync Playlist/Chapters/Voices)
         self.setup_view.session_updated.connect(lambda: self.gen_view.refresh_values())
         self.setup_view.session_updated.connect(lambda: self.playlist_view.refresh())
-        self.setup_view.session_updated.connect(lambda: self.chapters_view.model.refresh())
+        self.setup_view.session_updated.connect(self.chapters_view.request_refresh)
+        self.setup_view.session_updated.connect(lambda: self.controls_view.reset_session_state())
         
         # Wire Controls Structure Change (Sync Chapter List)
-        self.controls_view.structure_changed.connect(lambda: self.chapters_view.model.refresh())
+        self.controls_view.structure_changed.connect(self.chapters_view.request_refresh)
         # Wire ChaptersView Conv Chap (Sync Chapter List + Playlist)
         self.chapters_view.structure_changed.connect(lambda: self.chapters_view.model.refresh())
         self.chapters_view.structure_changed.connect(lambda: self.playlist_view.model.refresh())
@@ -234,9 +236,17 @@ class ChatterboxProQt(QMainWindow):
     def on_generation_finished(self) -> None:
         """Called when GenerationService finishes a run."""
         # 1. Tally Pass/Fail Rates
-        total_chunks = len([s for s in self.app_state.sentences if not s.get('is_pause')])
-        failed_chunks = len([s for s in self.app_state.sentences if s.get('tts_generated') == 'failed' and not s.get('is_pause')])
-        passed_chunks = len([s for s in self.app_state.sentences if s.get('tts_generated') == 'yes' and not s.get('is_pause')])
+        # Single pass over the playlist; large books have tens of thousands of chunks
+        total_chunks = failed_chunks = passed_chunks = 0
+        for s in self.app_state.sentences:
+            if s.get('is_pause'):
+                continue
+            total_chunks += 1
+            status = s.get('tts_generated')
+            if status == 'failed':
+                failed_chunks += 1
+            elif status == 'yes':
+                passed_chunks += 1
         
         # 2. Update UI Status Bar
         status_msg = f"Generation Finished. (Passed: {passed_chunks}, Failed: {failed_chunks})"
@@ -286,7 +296,8 @@ class ChatterboxProQt(QMainWindow):
         """Handle application closure: save state and cleanly shut down any running generation."""
 
         # --- Guard: Warn if generation is actively running ---
-        if hasattr(self, 'gen_service') and self.gen_service.is_running:
+        # (Skipped on the re-entrant close fired once background threads have exited.)
+        if not getattr(self, '_shutdown_pending', False) and hasattr(self, 'gen_service') and self.gen_service.is_running:
             reply = QMessageBox.question(
                 self,
                 "Generation In Progress",
@@ -301,25 +312,27 @@ class ChatterboxProQt(QMainWindow):
                 event.ignore()
                 return
 
+        # --- Stop background threads; close again when they report finished ---
+        # No blocking wait(): the UI stays responsive and closes the moment they exit.
+        pending = self._running_background_threads()
+        if pending:
+            if not getattr(self, '_shutdown_pending', False):
+                self._shutdown_pending = True
+                print("Stopping background threads and waiting for clean exit...", flush=True)
+                if hasattr(self, 'gen_service'):
+                    self.gen_service.request_stop()
+                for thread in pending:
+                    thread.finished.connect(self._on_background_thread_finished)
+                # Last resort if a worker refuses to stop in time
+                QTimer.singleShot(10_000, self._force_shutdown)
+            event.ignore()
+            return
+
         print("Saving session state...", flush=True)
 
         # Save Geometry
         self.app_state.window_geometry_hex = self.saveGeometry().toHex().data().decode()
 
-        # --- Stop generation and wait for the thread to exit cleanly ---
-        if hasattr(self, 'gen_service'):
-            gen_thread = self.gen_service.worker_thread
-            if gen_thread and gen_thread.isRunning():
-                print("Stopping generation thread and waiting for clean exit...", flush=True)
-                self.gen_service.request_stop()
-                # Wait up to 10 seconds for the thread to finish its current task.
-                # This prevents the "QThread: Destroyed while thread is still running" crash.
-                if not gen_thread.wait(10_000):
-                    # Last resort: forcefully terminate if it refused to stop in time.
-                    print("Thread did not stop in time — forcing termination.", flush=True)
-                    gen_thread.terminate()
-                    gen_thread.wait(2_000)
-
         # 1. Save App Config
         self.config_service.save_state(self.app_state)
 
@@ -333,6 +346,38 @@ class ChatterboxProQt(QMainWindow):
 
         event.accept()
 
+    def _running_background_threads(self) -> List[QThread]:
+        """Generation / assembly threads that are still running (deleted ones count as finished)."""
+        candidates = []
+        if hasattr(self, 'gen_service'):
+            candidates.append(self.gen_service.worker_thread)
+        if hasattr(self, 'assembly_service'):
+            candidates.append(self.assembly_service.running_thread())
+
+        running = []
+        for thread in candidates:
+            try:
+                if thread is not None and thread.isRunning():
+                    running.append(thread)
+            except RuntimeError:  # C++ object already removed via deleteLater
+                pass
+        return running
+
+    def _on_background_thread_finished(self) -> None:
+        if not self._running_background_threads():
+            self.close()
+
+    def _force_shutdown(self) -> None:
+        """Terminates threads that ignored the stop request, then finishes closing."""
+        pending = self._running_background_threads()
+        if not pending:
+            return
+        print("Thread did not stop in time — forcing termination.", flush=True)
+        for thread in pending:
+            thread.terminate()
+            thread.wait(2_000)
+        self.close()
+
 
 def launch_qt_app() -> None:
     # Create the Application
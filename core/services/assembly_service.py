@@ -6,10 +6,26 @@ import shutil
 import uuid
 import ffmpeg
 from pydub import AudioSegment
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, Signal, Slot, QThread
 from chatterbox.models.s3gen import S3GEN_SR
 from core.state import AppState
 
+class AssemblyWorker(QThread):
+    """
+    Runs one blocking assembly job off the UI thread.
+    Completion is reported through AssemblyService's own signals, which Qt
+    queues back to the UI thread, so nothing has to poll for the job ending.
+    """
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self):
+        self._fn(*self._args, **self._kwargs)
+
+
 class AssemblyService(QObject):
     """
     Handles final audiobook assembly and post-processing.
@@ -22,6 +38,55 @@ class AssemblyService(QObject):
     def __init__(self, app_state: AppState):
         super().__init__()
         self.state = app_state
+        self._worker = None
+
+    def running_thread(self):
+        """Returns the AssemblyWorker if an assembly job is in progress, else None."""
+        if self._worker is not None and self._worker.isRunning():
+            return self._worker
+        return None
+
+    def _run_in_background(self, fn, *args, **kwargs) -> bool:
+        """Starts `fn` on an AssemblyWorker. Only one assembly job runs at a time."""
+        if self.running_thread() is not None:
+            self.assembly_error.emit("An assembly job is already running.")
+            return False
+        self._worker = AssemblyWorker(fn, *args, **kwargs)
+        self._worker.start()
+        return True
+
+    def _snapshot_items(self) -> list:
+        """
+        Copies the sentence list in playback order. Taken on the UI thread so the
+        worker never reads app.sentences while the user edits or saves the session.
+        """
+        return sorted((dict(s) for s in self.state.sentences), key=lambda s: int(s['sentence_number']))
+
+    def _resolve_metadata(self, metadata=None) -> dict:
+        """Returns the title/artist/album tags, with `metadata` overriding the saved settings."""
+        s = self.state.settings
+        resolved = {"title": s.metadata_title, "artist": s.metadata_artist, "album": s.metadata_album}
+        if metadata:
+            resolved.update((k, metadata.get(k, "")) for k in resolved)
+        return resolved
+
+    def assemble_audiobook_async(self, output_path_str: str, is_for_acx=False, metadata=None) -> bool:
+        """Non-blocking assemble_audiobook(); result arrives via assembly_finished / assembly_error."""
+        # Persist the override here, on the UI thread; the worker only gets copies
+        if metadata:
+            s = self.state.settings
+            s.metadata_artist = metadata.get("artist", "")
+            s.metadata_album = metadata.get("album", "")
+            s.metadata_title = metadata.get("title", "")
+        return self._run_in_background(self.assemble_audiobook, output_path_str,
+                                       is_for_acx=is_for_acx, metadata=self._resolve_metadata(),
+                                       items=self._snapshot_items())
+
+    def export_by_chapter_async(self, output_dir_str) -> bool:
+        """Non-blocking export_by_chapter(); result arrives via assembly_finished / assembly_error."""
+        return self._run_in_background(self.export_by_chapter, output_dir_str,
+                                       items=self._snapshot_items(),
+                                       metadata=self._resolve_metadata())
     
     def _validate_settings(self) -> tuple[bool, str]:
         """
@@ -61,7 +126,12 @@ class AssemblyService(QObject):
         
         return True, ""
 
-    def assemble_audiobook(self, output_path_str: str, is_for_acx=False, metadata=None, quiet=False):
+    def assemble_audiobook(self, output_path_str: str, is_for_acx=False, metadata=None, quiet=False,
+                           items=None):
+        """
+        Concatenates `items` (default: a snapshot of the session) into one file.
+        Never writes to app state, so it is safe to run on an AssemblyWorker.
+        """
         if not output_path_str: 
             return
             
@@ -78,11 +148,7 @@ class AssemblyService(QObject):
                 logging.error(f"Assembly Error (Quiet): Invalid settings: {error_msg}")
             return
         
-        # Metadata override if provided
-        if metadata:
-            self.state.settings.metadata_artist = metadata.get("artist", "")
-            self.state.settings.metadata_album = metadata.get("album", "")
-            self.state.settings.metadata_title = metadata.get("title", "")
+        tags = self._resolve_metadata(metadata)
 
         session_name = app.session_name
         if not session_name:
@@ -91,7 +157,7 @@ class AssemblyService(QObject):
 
         session_path = Path("Outputs_Pro") / session_name 
         
-        all_items_in_order = sorted(app.sentences, key=lambda s: int(s['sentence_number']))
+        all_items_in_order = items if items is not None else self._snapshot_items()
         if not all_items_in_order:
              if not quiet: self.assembly_error.emit("No text chunks to assemble.")
              return
@@ -119,7 +185,7 @@ class AssemblyService(QObject):
                         continue
 
                     # Silence between chunks
-                    if len(app.sentences) > 1: 
+                    if len(all_items_in_order) > 1: 
                          pause_duration = app.settings.silence_duration
                          silence_file = temp_dir / f"silence_{s_data.get('uuid', 'unknown')}.wav"
                          AudioSegment.silent(duration=pause_duration, frame_rate=S3GEN_SR).export(silence_file, format="wav")
@@ -239,9 +305,9 @@ class AssemblyService(QObject):
                     'ac': 1,
                     'b:a': '192k',
                     'metadata': [
-                        f'title={app.settings.metadata_title}',
-                        f'artist={app.settings.metadata_artist}',
-                        f'album={app.settings.metadata_album}'
+                        f'title={tags["title"]}',
+                        f'artist={tags["artist"]}',
+                        f'album={tags["album"]}'
                     ]
                  }
                  (
@@ -267,13 +333,13 @@ class AssemblyService(QObject):
             if temp_dir.exists():
                 shutil.rmtree(temp_dir, ignore_errors=True)
 
-    def export_by_chapter(self, output_dir_str):
+    def export_by_chapter(self, output_dir_str, items=None, metadata=None):
         if not output_dir_str: return
         
         output_dir = Path(output_dir_str)
         app = self.state
         
-        all_items_in_order = sorted([s for s in app.sentences], key=lambda s: int(s['sentence_number']))
+        all_items_in_order = items if items is not None else self._snapshot_items()
         if not all_items_in_order:
             self.assembly_error.emit("No text chunks found.")
             return
@@ -294,7 +360,6 @@ class AssemblyService(QObject):
                 chapters.append(current_chapter_items)
 
         exported_count = 0
-        original_sentences = app.sentences
         
         try:
              for i, chapter_items in enumerate(chapters):
@@ -304,13 +369,11 @@ class AssemblyService(QObject):
                 chapter_filename_base = "".join([c for c in chapter_name_raw if c.isalnum() or c in ' ']).rstrip().replace(' ', '_')
                 final_chapter_path = output_dir / f"{i+1:02d}_{chapter_filename_base}.mp3"
                 
-                app.sentences = chapter_items
-                self.assemble_audiobook(str(final_chapter_path), is_for_acx=True, quiet=True)
+                self.assemble_audiobook(str(final_chapter_path), is_for_acx=True, metadata=metadata,
+                                        quiet=True, items=chapter_items)
                 exported_count += 1
              
              self.assembly_finished.emit(f"Exported {exported_count} chapters to {output_dir}")
              
         except Exception as e:
              self.assembly_error.emit(str(e))
-        finally:
-             app.sentences = original_sentences
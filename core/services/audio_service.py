@@ -2,6 +2,7 @@ from PySide6.QtCore import QObject, QUrl, Signal, Slot, QTimer
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from pathlib import Path
 import logging
+import os
 
 class AudioService(QObject):
     """
@@ -34,28 +35,39 @@ class AudioService(QObject):
         self.player.errorOccurred.connect(self._on_error)
         
         self.current_file = None
+        # (path, mtime) of the media loaded into the player; replaying it skips setSource()
+        self._loaded_media = None
 
-    def play_file(self, file_path: str):
-        """Plays the specified audio file."""
-        if not file_path: return
+    def play_file(self, file_path: str) -> bool:
+        """Plays the specified audio file. Returns False if it could not be started."""
+        if not file_path: return False
         
         path = Path(file_path)
-        if not path.exists():
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
             self.playback_error.emit(f"File not found: {path}")
-            return
+            return False
             
         try:
-            self.player.stop()
-            self.player.setSource(QUrl.fromLocalFile(str(path)))
+            self.player.stop()  # Also rewinds, so a reloaded source starts at 0
+            # Replaying the same chunk (common during QC) reuses the already-opened
+            # media; a regenerated file has a new mtime and is loaded afresh.
+            media = (str(path), mtime)
+            if media != self._loaded_media:
+                self.player.setSource(QUrl.fromLocalFile(str(path)))
+                self._loaded_media = media
             self.audio_output.setVolume(1.0) # Full volume
             self.player.play()
             self.current_file = str(path)
             self.playback_started.emit(self.current_file)
             logging.info(f"AudioService: Playing {path}")
+            return True
         except Exception as e:
             msg = f"Failed to play audio: {e}"
             logging.error(msg)
             self.playback_error.emit(msg)
+            return False
 
     @Slot(QMediaPlayer.MediaStatus)
     def _on_status_changed(self, status):
@@ -76,6 +88,7 @@ class AudioService(QObject):
 
     @Slot(QMediaPlayer.Error, str)
     def _on_error(self, error, error_string):
+        self._loaded_media = None  # Force a fresh setSource() on the next attempt
         self.playback_error.emit(f"QMediaPlayer Error: {error_string}")
         logging.error(f"QMediaPlayer Error: {error_string}")
         # If in queue, try next?
@@ -116,10 +129,9 @@ class AudioService(QObject):
             path = item.get('path')
             logging.info(f"AudioService: Queue Next [{self.queue_index}/{len(self.output_queue)}]: {path}")
             
-            if path and Path(path).exists():
-                self.play_file(path)
-            else:
-                logging.warning(f"AudioService: Queue skipping missing file: {path}")
+            # play_file() does the existence check (one stat per item)
+            if not (path and self.play_file(path)):
+                logging.warning(f"AudioService: Queue skipping missing or unplayable file: {path}")
                 self._play_next_in_queue()
 
     def _on_pause_finished(self):
@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import List, Dict, Any, Tuple
 
 class ChapterService:
@@ -17,11 +18,8 @@ class ChapterService:
         if not sentences:
             return chapters
             
-        # 1. Find all chapter starts
-        starts = []
-        for i, item in enumerate(sentences):
-            if item.get('is_chapter_heading'):
-                starts.append((i, item))
+        # 1. Find all chapter starts (the only O(N) step; runs as one comprehension)
+        starts = [(i, item) for i, item in enumerate(sentences) if item.get('is_chapter_heading')]
         
         # 2. Add implicit first chapter if none at 0? 
         # (Optional, but good UX if text starts without header)
@@ -60,10 +58,11 @@ class ChapterService:
         Given a list of selected *chapter* indices (0, 2, 5...),
         returns the list of *sentence* indices that belong to those chapters.
         """
-        indices_to_process = []
-        
         if not selected_chapter_indexes:
-            return indices_to_process
+            return []
+
+        # Work on [start, end) spans (one per chapter), not on every sentence index
+        spans = []
 
         for ch_idx in selected_chapter_indexes:
             # Safety check
@@ -86,8 +85,16 @@ class ChapterService:
                  else:
                      end_real_index = len(all_sentences)
 
-            # Collect all indices in [start, end)
-            indices_to_process.extend(range(start_real_index, end_real_index))
+            if start_real_index < end_real_index:
+                spans.append((start_real_index, end_real_index))
             
-        # Ensure unique and sorted
-        return sorted(list(set(indices_to_process)))
+        # Merge overlapping/adjacent spans, then expand once: already unique and sorted
+        spans.sort()
+        merged = []
+        for start, end in spans:
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1][1] = end
+            else:
+                merged.append([start, end])
+        return list(chain.from_iterable(range(start, end) for start, end in merged))
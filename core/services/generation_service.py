@@ -35,14 +35,29 @@ class GenerationThread(QThread):
     error_occurred = Signal(str)
     stopped = Signal()
 
-    def __init__(self, tasks: List[Any], max_workers: int, outputs_dir: str) -> None:
+    def __init__(self, tasks: List[Any], max_workers: int, outputs_dir: str,
+                 stale_paths: Optional[List[str]] = None) -> None:
         super().__init__()
         self.tasks = tasks
         self.max_workers = max_workers
         self.outputs_dir = outputs_dir
+        self.stale_paths = stale_paths or []  # Old WAVs of the chunks being regenerated
         self.stop_requested = multiprocessing.Event()
         self.executor: Optional[ProcessPoolExecutor] = None
 
+    def _remove_stale_files(self) -> None:
+        """Deletes the previous WAVs of the scheduled chunks (one syscall each, no exists() check)."""
+        for audio_path in self.stale_paths:
+            try:
+                os.remove(audio_path)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logging.warning(f"Failed to delete old WAV {audio_path}: {e}")
+                continue
+            logging.info(f"🗑️ Cleaned up old WAV file for regenerating chunk: {os.path.basename(audio_path)}")
+        self.stale_paths = []
+
     def request_stop(self) -> None:
         """Stops the loop and NUKES worker processes with extreme prejudice."""
         self.stop_requested.set()
@@ -96,6 +111,9 @@ class GenerationThread(QThread):
     def run(self) -> None:
         """The main blocking loop runs here, in a separate thread."""
         try:
+            # Before any worker starts, so a fresh WAV can never be the one deleted
+            self._remove_stale_files()
+            
             completed_count = 0
             total_tasks = len(self.tasks)
             self.progress_update.emit(0, total_tasks)
@@ -343,17 +361,12 @@ class GenerationService(QObject):
              ]
         else:
              # Full run (filter not-done items)
-             # Logic: Iterate ranges, collect all valid items
-             process_indices = []
-             for start, end in self._get_chapter_ranges():
-                 chunk = list(range(start, end))
-                 # Filter checks
-                 valid = [
-                     i for i in chunk 
-                     if self.state.sentences[i].get('tts_generated') != STATUS_YES 
-                     and not self.state.sentences[i].get('is_pause')
-                 ]
-                 process_indices.extend(valid)
+             # Chapter ranges tile the whole list in order, so one pass over it is equivalent
+             process_indices = [
+                 i for i, item in enumerate(self.state.sentences)
+                 if item.get('tts_generated') != STATUS_YES
+                 and not item.get('is_pause')
+             ]
 
         if not process_indices:
             logging.info("No chunks need generation (or all were pauses).")
@@ -361,18 +374,17 @@ class GenerationService(QObject):
             return
 
         # ONLY delete WAV files for chunks that are actively scheduled to be regenerated!
-        # This prevents the system from permanently wiping successful chunks and breaking Playback logic
+        # This prevents the system from permanently wiping successful chunks and breaking Playback logic.
+        # The state is reset here; the unlinks themselves run on the generation thread.
+        stale_paths = []
         for idx in process_indices:
             sentence = self.state.sentences[idx]
             audio_path = sentence.get('audio_path')
-            if audio_path and os.path.exists(audio_path):
-                try:
-                    os.remove(audio_path)
-                    logging.info(f"🗑️ Cleaned up old WAV file for regenerating chunk [{idx+1}]: {os.path.basename(audio_path)}")
-                    sentence['audio_path'] = None  # Clear the path reference
-                    sentence['tts_generated'] = 'no' # Reset status to prevent ghostly 'yes' UI
-                except Exception as e:
-                    logging.warning(f"Failed to delete old WAV {audio_path}: {e}")
+            if not audio_path:
+                continue
+            stale_paths.append(audio_path)
+            sentence['audio_path'] = None  # Clear the path reference
+            sentence['tts_generated'] = 'no' # Reset status to prevent ghostly 'yes' UI
 
         # 2. Configure Resources
         devices, max_workers = self._configure_workers(s.target_gpus, s.combine_gpus)
@@ -400,7 +412,7 @@ class GenerationService(QObject):
         self.stats_updated.emit(self.state.total_chunks, 0, 0)  # Initial stats
             
         # 5. Start Thread
-        self.worker_thread = GenerationThread(tasks, max_workers, outputs_dir)
+        self.worker_thread = GenerationThread(tasks, max_workers, outputs_dir, stale_paths)
         
         self.worker_thread.progress_update.connect(self.progress_update)
         self.worker_thread.batch_complete.connect(self._on_batch_complete)
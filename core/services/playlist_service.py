@@ -1,11 +1,15 @@
+import re
 import uuid
 import logging
 from typing import List, Dict, Any, Optional
-from itertools import groupby
+from itertools import chain, groupby
 from operator import itemgetter
 from core.state import AppState
 from utils.text_processor import TextPreprocessor
 
+# Duration inside a pause marker, e.g. "[PAUSE: 1500ms]"
+_PAUSE_MS_RE = re.compile(r'(\d+)\s*ms')
+
 class PlaylistService:
     """
     Handles modification of the sentence list (splitting, merging, editing, etc.).
@@ -17,7 +21,6 @@ class PlaylistService:
         
     def _create_base_item(self, text: str, marked: bool = False, is_chapter_heading: bool = False) -> Dict[str, Any]:
         """Creates a standardized sentence item, auto-detecting PAUSE markers and applying correct flags."""
-        import re
         import uuid
         
         is_pause = False
@@ -34,7 +37,7 @@ class PlaylistService:
             is_chapter_heading = False
             
             # Try to grab duration 
-            m = re.search(r'(\d+)\s*ms', clean_text)
+            m = _PAUSE_MS_RE.search(clean_text)
             duration = int(m.group(1)) if m else 500
             
         item = {
@@ -87,12 +90,11 @@ class PlaylistService:
             item['original_sentence'] = clean_text
             
             if clean_text.startswith('[PAUSE'):
-                import re
                 item['is_pause'] = True
                 item['tts_generated'] = 'n/a'
                 item['marked'] = False
                 if not item.get('duration'):
-                    m = re.search(r'(\d+)\s*ms', clean_text)
+                    m = _PAUSE_MS_RE.search(clean_text)
                     item['duration'] = int(m.group(1)) if m else 500
             else:
                 item['is_pause'] = False
@@ -127,20 +129,21 @@ class PlaylistService:
 
         # Create new items
         new_items = []
+        is_chapter = self.processor.is_chapter_heading
         for idx_s, s in enumerate(split_sentences):
             s_clean = s.strip()
             if not s_clean: continue
 
             # First child inherits is_chapter_heading from parent so the chapter
             # heading is NOT silently deleted when a heading is split to clean it up.
-            is_ch = was_chapter if idx_s == 0 else bool(self.processor.chapter_regex.match(s_clean))
+            is_ch = was_chapter if idx_s == 0 else is_chapter(s_clean)
 
             new_item = self._create_base_item(s_clean, marked=False, is_chapter_heading=is_ch)
             new_items.append(new_item)
 
         # Replace old item with new items
         self.state.sentences[index:index+1] = new_items
-        self._renumber()
+        self._renumber(index)
         return True
 
     def insert_item(self, index: int, text: str, is_pause: bool = False, duration: int = 0, is_chapter: bool = False):
@@ -156,13 +159,15 @@ class PlaylistService:
         # If list empty, append.
         if index < 0: index = len(self.state.sentences)
         self.state.sentences.insert(index, new_item)
-        self._renumber()
+        self._renumber(index)
 
     def toggle_selection_mark(self, indices: List[int]) -> None:
         """Toggles the 'marked' status of selected items."""
+        sentences = self.state.sentences
+        count = len(sentences)
         for idx in indices:
-            if 0 <= idx < len(self.state.sentences):
-                item = self.state.sentences[idx]
+            if 0 <= idx < count:
+                item = sentences[idx]
                 
                 # Special Logic for Pauses: Can UNMARK, but cannot MARK
                 if item.get('is_pause'):
@@ -195,12 +200,11 @@ class PlaylistService:
         """Deletes items at indices. Returns count deleted."""
         if not indices: return 0
         
-        # Sort reverse to avoid index shifting problems
-        for idx in sorted(indices, reverse=True):
-            if 0 <= idx < len(self.state.sentences):
-                self.state.sentences.pop(idx)
+        # One rebuild pass; pop()ing each index would shift the tail once per delete
+        to_delete = set(indices)
+        self.state.sentences = [item for i, item in enumerate(self.state.sentences) if i not in to_delete]
                 
-        self._renumber()
+        self._renumber(min(indices))
         return len(indices)
 
     def move_items(self, indices: List[int], direction: int) -> List[int]:
@@ -208,25 +212,24 @@ class PlaylistService:
         if not indices: return []
         
         sorted_indices = sorted(indices, reverse=(direction == 1))
-        new_indices = set()
-        moved = False
         
-        temp_list = list(self.state.sentences) # Copy
+        # Swap in place: no full-list copy. Whether a row can move depends only on
+        # its index, so the boundary check is done once up front.
+        sentences = self.state.sentences
+        count = len(sentences)
+        can_move = [0 <= idx + direction < count for idx in sorted_indices]
+        if not any(can_move):
+            return indices  # Whole selection is against the boundary; list untouched
         
-        for idx in sorted_indices:
-            new_idx = idx + direction
-            if 0 <= new_idx < len(temp_list):
-                 temp_list[idx], temp_list[new_idx] = temp_list[new_idx], temp_list[idx]
-                 new_indices.add(new_idx)
-                 moved = True
-            else:
-                 new_indices.add(idx) # Kept at boundary
-                 
-        if moved:
-            self.state.sentences = temp_list
-            self._renumber()
-            return sorted(list(new_indices))
-        return indices
+        for idx, ok in zip(sorted_indices, can_move):
+            if ok:
+                new_idx = idx + direction
+                sentences[idx], sentences[new_idx] = sentences[new_idx], sentences[idx]
+        
+        # Rows at the boundary stay where they are
+        new_indices = {idx + direction if ok else idx for idx, ok in zip(sorted_indices, can_move)}
+        self._renumber(min(min(indices), min(new_indices)))
+        return sorted(new_indices)
 
     def search(self, query: str) -> List[str]:
         if not query: return []
@@ -273,37 +276,53 @@ class PlaylistService:
         return replaced_count
 
     def find_next_status(self, start_index: int, direction: int, status: str) -> int:
-        """Finds next item with specific status (e.g. 'failed')."""
-        count = len(self.state.sentences)
+        """
+        Finds the next item with a specific status (e.g. 'failed') after `start_index`,
+        wrapping around once. `start_index` -1 (no selection) searches the whole list.
+        """
+        sentences = self.state.sentences
+        count = len(sentences)
         if count == 0: return -1
         
-        curr = start_index + direction
-        looped = False
+        # The two halves of the wrapped search, in visiting order; start itself is skipped
+        if direction == 1:
+            if start_index < 0:
+                order = range(count)
+            else:
+                order = chain(range(start_index + 1, count), range(0, min(start_index, count)))
+        else:
+            if start_index < 0:
+                order = range(count - 1, -1, -1)
+            else:
+                order = chain(range(min(start_index, count) - 1, -1, -1), range(count - 1, start_index, -1))
         
-        while curr != start_index:
-            if curr < 0: curr = count - 1
-            if curr >= count: curr = 0
-            
-            # Correction for initial -1 start
-            if start_index == -1 and not looped:
-                if direction == 1: curr = 0
-                else: curr = count - 1
-                looped = True # Only jump once
-            
-            item = self.state.sentences[curr]
-            if item.get('tts_generated') == status:
-                return curr
-            
-            curr += direction
-            
-            # Break if full loop
-            if curr == start_index: break
-            
+        for i in order:
+            if sentences[i]['tts_generated'] == status:
+                return i
         return -1
 
-    def _renumber(self):
+    def _renumber(self, start: int = 0):
+        """Rewrites sentence_number from `start` on; rows above the edit point are unchanged."""
+        sentences = self.state.sentences
+        for i in range(max(start, 0), len(sentences)):
+            sentences[i]['sentence_number'] = str(i + 1)
+
+    def _apply_replacements(self, replacements: Dict[int, List[Dict[str, Any]]]) -> None:
+        """
+        Swaps each row index in `replacements` for its list of new items in a single
+        rebuild; splicing them in one by one would shift the tail once per split.
+        """
+        if not replacements:
+            return
+        rebuilt = []
         for i, item in enumerate(self.state.sentences):
-            item['sentence_number'] = str(i + 1)
+            new_items = replacements.get(i)
+            if new_items is None:
+                rebuilt.append(item)
+            else:
+                rebuilt.extend(new_items)
+        self.state.sentences = rebuilt
+        self._renumber(min(replacements))
 
     def merge_failed_down(self) -> int:
         """Merges failed chunks into the chunk below them.
@@ -312,25 +331,24 @@ class PlaylistService:
         the chapter structure that the user has established.
         """
         merged_count = 0
-        i = 0
-        while i < len(self.state.sentences) - 1:
-            curr = self.state.sentences[i]
-
+        first_merged = None
+        sentences = self.state.sentences
+        last = len(sentences) - 1
+        # Rebuild once instead of pop()ing each merged row (every pop shifts the tail)
+        kept = []
+        for i, curr in enumerate(sentences):
             # GUARD: never merge a chapter heading away, and never merge INTO one.
-            if curr.get('is_chapter_heading'):
-                i += 1
-                continue
-
-            if curr.get('tts_generated') == 'failed':
-                next_item = self.state.sentences[i + 1]
+            # The last row has nothing below it to merge into.
+            if i < last and curr['tts_generated'] == 'failed' and not curr.get('is_chapter_heading'):
+                next_item = sentences[i + 1]
 
                 # GUARD: don't merge into a chapter heading
                 if next_item.get('is_chapter_heading'):
-                    i += 1
+                    kept.append(curr)
                     continue
 
-                # Merge text
-                merged_text = (curr.get('original_sentence', '') + " " + next_item.get('original_sentence', '')).strip()
+                # Merge text (next_item is reset to 'no', so it is kept on its own turn)
+                merged_text = " ".join((curr.get('original_sentence', ''), next_item.get('original_sentence', ''))).strip()
                 next_item['original_sentence'] = merged_text
                 next_item['tts_generated'] = 'no'
                 next_item['marked'] = False
@@ -341,15 +359,17 @@ class PlaylistService:
                     if k in next_item:
                         del next_item[k]
 
-                # Remove current
-                self.state.sentences.pop(i)
+                # Drop current
                 merged_count += 1
-                # Don't increment i — check this slot again (now holds next_item)
-            else:
-                i += 1
+                if first_merged is None:
+                    first_merged = len(kept)
+                continue
+
+            kept.append(curr)
 
         if merged_count > 0:
-            self._renumber()
+            self.state.sentences = kept
+            self._renumber(first_merged)
         return merged_count
 
     def merge_selected(self, indices: List[int]) -> int:
@@ -369,15 +389,13 @@ class PlaylistService:
                 logging.warning("Merge Selected: Indices are not contiguous.")
                 return 0
                 
+        sentences = self.state.sentences
         first_idx = indices[0]
-        first_item = self.state.sentences[first_idx]
+        first_item = sentences[first_idx]
         
         # Combine text of all selected items that are not pauses
-        text_parts = []
-        for idx in indices:
-            item = self.state.sentences[idx]
-            if not item.get('is_pause'):
-                text_parts.append(item.get('original_sentence', '').strip())
+        text_parts = [sentences[idx].get('original_sentence', '').strip()
+                      for idx in indices if not sentences[idx].get('is_pause')]
                 
         if not text_parts:
             # They only selected pauses
@@ -389,49 +407,37 @@ class PlaylistService:
         is_chapter = first_item.get('is_chapter_heading', False)
         new_item = self._create_base_item(merged_text, marked=False, is_chapter_heading=is_chapter)
         
-        # Remove old ones from back to front to avoid index shifting
-        for idx in reversed(indices):
-            self.state.sentences.pop(idx)
-            
-        self.state.sentences.insert(first_idx, new_item)
+        # Replace the (contiguous) selection in one splice
+        sentences[first_idx:indices[-1] + 1] = [new_item]
         
-        self._renumber()
+        self._renumber(first_idx)
         return len(indices)
 
     def split_all_failed(self) -> int:
         """Splits all failed chunks using the sentence splitter."""
-        split_count = 0
-        i = 0
-        while i < len(self.state.sentences):
-            item = self.state.sentences[i]
-            if item.get('tts_generated') == 'failed':
+        replacements = {}
+        is_chapter = self.processor.is_chapter_heading
+        for i, item in enumerate(self.state.sentences):
+            if item['tts_generated'] == 'failed':
                 text = item.get('original_sentence', '')
                 split_sentences = self.processor.splitter.split(text)
                 
                 if len(split_sentences) > 1:
                      new_items = []
                      for s in split_sentences:
-                        if not s.strip(): continue
-                        is_ch = bool(self.processor.chapter_regex.match(s.strip()))
-                        new_items.append(self._create_base_item(s.strip(), marked=True, is_chapter_heading=is_ch))
-                     
-                     self.state.sentences[i:i+1] = new_items
-                     split_count += 1
-                     i += len(new_items) # Skip over new items
-                     continue
-            i += 1
+                        s_clean = s.strip()
+                        if not s_clean: continue
+                        new_items.append(self._create_base_item(s_clean, marked=True, is_chapter_heading=is_chapter(s_clean)))
+                     replacements[i] = new_items
             
-        if split_count > 0:
-            self._renumber()
-        return split_count
+        self._apply_replacements(replacements)
+        return len(replacements)
 
     def split_all_failed_half(self) -> int:
         """Splits all failed chunks exactly in half by sentence count."""
-        split_count = 0
-        i = 0
-        while i < len(self.state.sentences):
-            item = self.state.sentences[i]
-            if item.get('tts_generated') == 'failed':
+        replacements = {}
+        for i, item in enumerate(self.state.sentences):
+            if item['tts_generated'] == 'failed':
                 text = item.get('original_sentence', '')
                 
                 # Use the robust sentence splitter that understands abbreviations/initials
@@ -455,22 +461,19 @@ class PlaylistService:
                     if new_items:
                         # preserve chapter heading for the first piece if original had it
                         new_items[0]['is_chapter_heading'] = item.get('is_chapter_heading', False)
-                        self.state.sentences[i:i+1] = new_items
-                        split_count += 1
-                        i += len(new_items) # Skip over new items
-                        continue
-            i += 1
+                        replacements[i] = new_items
             
-        if split_count > 0:
-            self._renumber()
-        return split_count
-
-    def clean_special_chars_selected(self, indices: List[int]) -> int:
-        """Removes special chars from selected items."""
-        count = 0
+        self._apply_replacements(replacements)
+        return len(replacements)
+
+    def clean_special_chars_selected(self, indices: List[int]) -> List[int]:
+        """Removes special chars from selected items. Returns the indices that changed."""
+        changed = []
+        sentences = self.state.sentences
+        count = len(sentences)
         for idx in indices:
-            if 0 <= idx < len(self.state.sentences):
-                item = self.state.sentences[idx]
+            if 0 <= idx < count:
+                item = sentences[idx]
                 text = item.get('original_sentence', '')
                 # Use TextPreprocessor's clean_text_aggressively
                 cleaned = self.processor.clean_text_aggressively(text)
@@ -478,15 +481,17 @@ class PlaylistService:
                     item['original_sentence'] = cleaned
                     item['tts_generated'] = 'no'
                     item['marked'] = False
-                    count += 1
-        return count
-
-    def filter_non_english_in_selected(self, indices: List[int]) -> int:
-        """Filters non-english words from selected items."""
-        count = 0
+                    changed.append(idx)
+        return changed
+
+    def filter_non_english_in_selected(self, indices: List[int]) -> List[int]:
+        """Filters non-english words from selected items. Returns the indices that changed."""
+        changed = []
+        sentences = self.state.sentences
+        count = len(sentences)
         for idx in indices:
-            if 0 <= idx < len(self.state.sentences):
-                item = self.state.sentences[idx]
+            if 0 <= idx < count:
+                item = sentences[idx]
                 text = item.get('original_sentence', '')
                 filtered = self.processor.filter_non_english_words(text)
                 
@@ -494,8 +499,8 @@ class PlaylistService:
                     item['original_sentence'] = filtered
                     item['tts_generated'] = 'no'
                     item['marked'] = True
-                    count += 1
-        return count
+                    changed.append(idx)
+        return changed
 
     def apply_auto_pause_buffers(self, before_ms: int, after_ms: int) -> Dict[str, int]:
         """
@@ -541,7 +546,7 @@ class PlaylistService:
             
             i -= 1
             
-        self._renumber()
+        # insert_item() already renumbered from each insertion point
         return stats
 
     def reflow_marked_items(self) -> int:
@@ -552,9 +557,10 @@ class PlaylistService:
         Chapter headings are excluded from reflow — any group that contains a
         chapter heading is skipped entirely so `is_chapter_heading` is never lost.
         """
-        if not self.state.sentences: return 0
+        sentences = self.state.sentences  # Groups are replaced in place, so this stays current
+        if not sentences: return 0
 
-        marked_indices = [i for i, s in enumerate(self.state.sentences) if s.get('marked')]
+        marked_indices = [i for i, s in enumerate(sentences) if s.get('marked')]
         if not marked_indices: return 0
 
         groups = []
@@ -570,28 +576,26 @@ class PlaylistService:
 
             # GUARD: skip any group that contains a chapter heading.
             # Reflowing merges text, which would silently destroy the heading flag.
-            if any(self.state.sentences[idx].get('is_chapter_heading') for idx in group):
+            if any(sentences[idx].get('is_chapter_heading') for idx in group):
                 logging.debug(f"[reflow] Skipping group {group} — contains chapter heading.")
                 continue
 
             start_idx = group[0]
-            full_text = ""
-            for idx in group:
-                full_text += " " + self.state.sentences[idx].get('original_sentence', '')
-
-            full_text = full_text.strip()
+            # One join per run instead of growing the string row by row
+            full_text = " ".join(sentences[idx].get('original_sentence', '') for idx in group).strip()
 
             raw_sentences = (self.processor.splitter.split(full_text)
                              if self.processor.splitter
                              else self.processor.simple_split_re.split(full_text))
 
             sentence_dicts = []
+            is_chapter = self.processor.is_chapter_heading
             for s in raw_sentences:
                 s_clean = s.strip()
                 if not s_clean: continue
                 sentence_dicts.append({
                     "original_sentence": s_clean,
-                    "is_chapter_heading": bool(self.processor.chapter_regex.match(s_clean))
+                    "is_chapter_heading": is_chapter(s_clean)
                 })
 
             new_chunks = self.processor.group_sentences_into_chunks(sentence_dicts, max_chars=max_chars)
@@ -600,24 +604,22 @@ class PlaylistService:
                 chunk['tts_generated'] = 'no'
                 chunk['marked'] = False
 
-            self.state.sentences[start_idx: start_idx + len(group)] = new_chunks
+            sentences[start_idx: start_idx + len(group)] = new_chunks
             processed_count += len(group)
+            first_changed = start_idx  # Groups run bottom-up, so this ends at the lowest
 
         if processed_count > 0:
-            self._renumber()
+            self._renumber(first_changed)
 
         return processed_count
 
     def split_all_marked(self) -> int:
         """Splits all marked chunks using the sentence splitter."""
-        split_count = 0
-        i = 0
-        while i < len(self.state.sentences):
-            item = self.state.sentences[i]
-            
+        replacements = {}
+        is_chapter = self.processor.is_chapter_heading
+        for i, item in enumerate(self.state.sentences):
             # GUARD: Do not batch-split chapter headings
             if item.get('is_chapter_heading'):
-                i += 1
                 continue
                 
             if item.get('marked'):
@@ -627,16 +629,10 @@ class PlaylistService:
                 if len(split_sentences) > 1:
                      new_items = []
                      for s in split_sentences:
-                        if not s.strip(): continue
-                        is_ch = bool(self.processor.chapter_regex.match(s.strip()))
-                        new_items.append(self._create_base_item(s.strip(), marked=True, is_chapter_heading=is_ch))
-                     
-                     self.state.sentences[i:i+1] = new_items
-                     split_count += 1
-                     i += len(new_items) # Skip over new items
-                     continue
-            i += 1
+                        s_clean = s.strip()
+                        if not s_clean: continue
+                        new_items.append(self._create_base_item(s_clean, marked=True, is_chapter_heading=is_chapter(s_clean)))
+                     replacements[i] = new_items
             
-        if split_count > 0:
-            self._renumber()
-        return split_count
+        self._apply_replacements(replacements)
+        return len(replacements)
@@ -1,10 +1,64 @@
 import os
-import shutil
+import re
 import logging
 import json
+import math
+import hashlib
+import shutil
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+try:
+    import orjson  # Optional: much faster session (de)serialization
+except ImportError:
+    orjson = None
+
+
+# The only sentence fields that hold computed floats (ASR score, clip length)
+_SENTENCE_FLOAT_FIELDS = ('similarity_ratio', 'duration')
+
+
+def _has_non_finite(data: Dict[str, Any]) -> bool:
+    """
+    True if a float field of the session is NaN/Infinity. Checks only the fields
+    that can hold one, so the check stays far cheaper than the encode it guards.
+    """
+    for value in (data.get('generation_settings') or {}).values():
+        if isinstance(value, float) and not math.isfinite(value):
+            return True
+    for item in data.get('sentences') or ():
+        for key in _SENTENCE_FLOAT_FIELDS:
+            value = item.get(key)
+            if isinstance(value, float) and not math.isfinite(value):
+                return True
+    return False
+
+
+def _dumps_session(data: Dict[str, Any]) -> bytes:
+    """Serializes session data to compact UTF-8 JSON bytes."""
+    # orjson writes NaN/Infinity as null (it never raises on them); json keeps them
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # A value orjson can't encode (e.g. float subclass); let json try
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _loads_session(raw: bytes) -> Dict[str, Any]:
+    """Parses session JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity written by json.dump; json accepts those
+    return json.loads(raw)
+
+
+# Duration inside a legacy pause marker, e.g. "[PAUSE : 1500ms]"
+_PAUSE_MS_RE = re.compile(r'(\d+)\s*ms')
+
+
 class ProjectService:
     """
     Handles project-level logical operations:
@@ -21,6 +75,8 @@ class ProjectService:
             self.outputs_dir = target
             
         self.outputs_dir.mkdir(parents=True, exist_ok=True)
+        # session name -> digest of the JSON last written, to skip no-op saves
+        self._saved_digests: Dict[str, bytes] = {}
 
     def get_audio_path(self, session_name: str, audio_filename: str) -> Path:
         """Construct the absolute path for an audio file."""
@@ -69,15 +125,15 @@ class ProjectService:
             
         f_path = Path(self.outputs_dir) / session_name / "Sentence_wavs" / f"audio_{uuid_str}.wav"
         
-        if f_path.exists():
-            try:
-                os.remove(f_path)
-                logging.info(f"Deleted orphaned audio file: {f_path.name}")
-                return True
-            except OSError as e:
-                logging.error(f"Failed to delete audio file {f_path}: {e}")
-                return False
-        return False
+        try:
+            os.remove(f_path)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logging.error(f"Failed to delete audio file {f_path}: {e}")
+            return False
+        logging.info(f"Deleted orphaned audio file: {f_path.name}")
+        return True
 
     def save_session(self, session_name: str, data: Dict[str, Any]) -> bool:
         """
@@ -93,18 +149,40 @@ class ProjectService:
             session_path.resolve().mkdir(parents=True, exist_ok=True)
             
             json_path = session_path / f"{session_name}_session.json"
+            tmp_path = session_path / f"{session_name}_session.json.tmp"
             
-            # Create Backup if exists
+            payload = _dumps_session(data)
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            # Nothing changed since the last save: keep the file (and the .bak) as they are
+            if self._saved_digests.get(session_name) == digest and json_path.exists():
+                logging.info(f"Session '{session_name}' unchanged; skipped write.")
+                return True
+            
+            # Write the new file completely before touching the old one, so a crash
+            # mid-write can never leave a truncated session. Compact JSON: the
+            # sentence list is the bulk of the file and indent=4 roughly tripled it.
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            
+            # Previous version becomes the backup. Hard-link it (copy if the filesystem
+            # can't), so the live file stays in place until the single replace below.
             if json_path.exists():
+                backup_path = session_path / f"{session_name}_session.bak"
+                link_path = session_path / f"{session_name}_session.bak.tmp"
                 try:
-                    backup_path = session_path / f"{session_name}_session.bak"
-                    shutil.copy2(json_path, backup_path)
+                    try:
+                        if link_path.exists():
+                            link_path.unlink()
+                        os.link(json_path, link_path)
+                        os.replace(link_path, backup_path)
+                    except OSError:
+                        shutil.copy2(json_path, backup_path)
                     logging.info(f"Created backup: {backup_path}")
                 except Exception as e:
                     logging.warning(f"Failed to create backup: {e}")
             
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            os.replace(tmp_path, json_path)
+            self._saved_digests[session_name] = digest
                 
             logging.info(f"Session '{session_name}' saved to {json_path}")
             return True
@@ -153,10 +231,11 @@ class ProjectService:
             return None
             
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_path, 'rb') as f:
+                data = _loads_session(f.read())
 
-            # Heal legacy pause records that predate the is_pause flag
+            # Heal legacy pause records that predate the is_pause flag; this also
+            # guarantees every item has a 'tts_generated' status for the status scans
             healed = self._heal_pause_records(data.get('sentences', []))
             if healed:
                 logging.info(f"Healed {healed} legacy pause record(s) in session '{path.name}'.")
@@ -172,19 +251,20 @@ class ProjectService:
     def _heal_pause_records(sentences: list) -> int:
         """
         Fixes legacy pause items that have original_sentence='[PAUSE]' but are
-        missing the is_pause flag or the duration field.
-        Returns the count of items healed.
+        missing the is_pause flag or the duration field, and gives any item
+        without a 'tts_generated' status the default 'no'.
+        Returns the count of pause items healed.
         """
-        import re
         healed = 0
         for item in sentences:
+            item.setdefault('tts_generated', 'no')
             text = item.get('original_sentence', '')
             if not item.get('is_pause') and str(text).strip().startswith('[PAUSE'):
                 item['is_pause'] = True
                 item['tts_generated'] = 'n/a'
                 # Try to parse duration from [PAUSE : 1500ms] or [PAUSE: 1500ms]
                 if not item.get('duration'):
-                    m = re.search(r'(\d+)\s*ms', text)
+                    m = _PAUSE_MS_RE.search(text)
                     item['duration'] = int(m.group(1)) if m else 500
                 healed += 1
         return healed
@@ -1,8 +1,9 @@
+import copy
 import json
 import os
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 class TemplateService:
     def __init__(self, templates_dir: str = "Templates"):
@@ -21,16 +22,25 @@ class TemplateService:
             self.templates_dir = target
             
         self.templates_dir.mkdir(exist_ok=True, parents=True)
+        # (directory mtime, names): adding/removing/renaming a file bumps the dir mtime
+        self._list_cache: Optional[Tuple[int, List[str]]] = None
+        # name -> (file mtime, parsed template); a voice is reloaded far more often than saved
+        self._template_cache: Dict[str, Tuple[int, Dict]] = {}
 
     def list_templates(self) -> List[str]:
         """Returns a sorted list of template names (without extension)."""
         try:
+            mtime = os.stat(self.templates_dir).st_mtime_ns
+            if self._list_cache is not None and self._list_cache[0] == mtime:
+                return list(self._list_cache[1])
+            
             logging.debug(f"Looking for templates in: {self.templates_dir}")
-            files = list(self.templates_dir.glob("*.json"))
-            logging.debug(f"Found {len(files)} template files: {[f.name for f in files]}")
-            result = sorted([f.stem for f in files])
+            # scandir: names come from the directory listing, no stat per entry
+            with os.scandir(self.templates_dir) as it:
+                result = sorted(e.name[:-5] for e in it if e.name.endswith('.json'))
             logging.debug(f"Returning template names: {result}")
-            return result
+            self._list_cache = (mtime, result)
+            return list(result)
         except Exception as e:
             logging.error(f"Failed to list templates: {e}", exc_info=True)
             return []
@@ -39,11 +49,18 @@ class TemplateService:
         """Loads a template by name."""
         try:
             path = self.templates_dir / f"{name}.json"
-            if not path.exists():
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                self._template_cache.pop(name, None)
                 return None
             
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            cached = self._template_cache.get(name)
+            if cached is None or cached[0] != mtime:
+                with open(path, 'r', encoding='utf-8') as f:
+                    cached = self._template_cache[name] = (mtime, json.load(f))
+            # Callers apply values straight onto settings; never hand out the cached object
+            return copy.deepcopy(cached[1])
         except Exception as e:
             logging.error(f"Failed to load template '{name}': {e}")
             return None
@@ -53,7 +70,10 @@ class TemplateService:
         try:
             path = self.templates_dir / f"{name}.json"
             with open(path, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=4)
+                json.dump(settings, f, separators=(',', ':'), ensure_ascii=False)
+            # Don't rely on mtime granularity for our own writes
+            self._list_cache = None
+            self._template_cache.pop(name, None)
             return True
         except Exception as e:
             logging.error(f"Failed to save template '{name}': {e}")
@@ -65,6 +85,8 @@ class TemplateService:
             path = self.templates_dir / f"{name}.json"
             if path.exists():
                 path.unlink()
+                self._list_cache = None
+                self._template_cache.pop(name, None)
                 return True
             return False
         except Exception as e:
@@ -1,12 +1,36 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QFrame, QSizePolicy)
-from PySide6.QtCore import Qt, Property
+from PySide6.QtCore import Qt, Property, QTimer
 
 class CollapsibleFrame(QWidget):
     """
     A Qt equivalent of the legacy CustomTkinter CollapsibleFrame.
     Consists of a Header Button (toggle) and a Content Frame.
     """
-    def __init__(self, title="", parent=None, start_open=True):
+    # Shared by every header; built once at class creation instead of per instance
+    _HEADER_STYLE = """
+        QPushButton {
+            text-align: left; 
+            font-weight: bold; 
+            border: none;
+            background-color: #455A64; 
+            color: white;
+            padding: 2px 10px;
+            height: 24px;
+            border-radius: 4px;
+        }
+        QPushButton:hover {
+            background-color: #546E7A;
+        }
+        QPushButton:checked {
+            background-color: #37474F;
+        }
+    """
+
+    def __init__(self, title="", parent=None, start_open=True, builder=None):
+        """
+        `builder(frame)` (optional) populates the content area. It runs once,
+        on first open, so sections that start closed cost nothing until used.
+        """
         super().__init__(parent)
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -14,24 +38,7 @@ class CollapsibleFrame(QWidget):
         
         # Header Button
         self.toggle_btn = QPushButton(f"▼ {title}")
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                text-align: left; 
-                font-weight: bold; 
-                border: none;
-                background-color: #455A64; 
-                color: white;
-                padding: 2px 10px;
-                height: 24px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #546E7A;
-            }
-            QPushButton:checked {
-                background-color: #37474F;
-            }
-        """)
+        self.toggle_btn.setStyleSheet(self._HEADER_STYLE)
         self.toggle_btn.setCheckable(True)
         self.toggle_btn.setChecked(start_open)
         self.toggle_btn.toggled.connect(self.on_toggle)
@@ -44,20 +51,49 @@ class CollapsibleFrame(QWidget):
         self.layout.addWidget(self.content_area)
         
         self.title_text = title
+        self._visibility_pending = False
+        self._builder = builder
+        self._is_open = None  # Last applied state; None until first sync
         
-        # Initial State
-        self.on_toggle(start_open)
+        self._last_header = None
+        
+        # Initial State (applied immediately so the frame never flashes open)
+        self._set_header(start_open)
+        self._apply_visibility()
 
     def on_toggle(self, checked):
         """Show/Hide content."""
-        if checked:
+        self._set_header(checked)
+        # Defer the relayout to the event loop: rapid toggles (open then shut again)
+        # then cost at most one visibility change instead of one relayout per signal.
+        if not self._visibility_pending:
+            self._visibility_pending = True
+            QTimer.singleShot(0, self._apply_visibility)
+
+    def _set_header(self, is_open):
+        """Updates the arrow on the header, skipping the call if the text is unchanged."""
+        text = f"{'▼' if is_open else '▶'} {self.title_text}"
+        if text != self._last_header:
+            self._last_header = text
+            self.toggle_btn.setText(text)
+
+    def _apply_visibility(self):
+        """Syncs the content area with the button's current checked state."""
+        self._visibility_pending = False
+        is_open = self.toggle_btn.isChecked()
+        if is_open == self._is_open:
+            return  # e.g. toggled open and shut again before the deferred sync ran
+        self._is_open = is_open
+        
+        if is_open:
+            if self._builder is not None:
+                builder, self._builder = self._builder, None
+                builder(self)
             self.content_area.setVisible(True)
             self.content_area.setMaximumHeight(16777215)  # Qt's QWIDGETSIZE_MAX
-            self.toggle_btn.setText(f"▼ {self.title_text}")
         else:
             self.content_area.setVisible(False)
             self.content_area.setMaximumHeight(0)  # Collapse to zero height
-            self.toggle_btn.setText(f"▶ {self.title_text}")
 
     def add_widget(self, widget):
         """Adds a widget to the content area."""
@@ -65,3 +101,4 @@ class CollapsibleFrame(QWidget):
 
     def add_layout(self, layout):
         self.content_layout.addLayout(layout)
+
@@ -9,6 +9,9 @@ class ProgressWidget(QWidget):
     """
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
+        # Last rendered values; callers tick faster than the labels can change
+        self._last_eta_secs = -1
+        self._last_progress = None
         self.setup_ui()
         
     def setup_ui(self) -> None:
@@ -84,6 +87,10 @@ class ProgressWidget(QWidget):
             completed: Number of chunks completed
             total: Total number of chunks
         """
+        if (completed, total) == self._last_progress:
+            return
+        self._last_progress = (completed, total)
+        
         self.progress_bar.setMaximum(total)
         self.progress_bar.setValue(completed)
         
@@ -114,12 +121,18 @@ class ProgressWidget(QWidget):
         Args:
             seconds_remaining: Estimated seconds until completion
         """
-        if seconds_remaining <= 0:
+        # ETA resolution is 1s; skip the relayout if the label wouldn't change
+        secs = int(seconds_remaining) if seconds_remaining > 0 else None
+        if secs == self._last_eta_secs:
+            return
+        self._last_eta_secs = secs
+        
+        if secs is None:
             self.lbl_eta.setText("ETA: Calculating...")
             return
         
         # Format time
-        minutes, seconds = divmod(int(seconds_remaining), 60)
+        minutes, seconds = divmod(secs, 60)
         hours, minutes = divmod(minutes, 60)
         
         if hours > 0:
@@ -133,6 +146,8 @@ class ProgressWidget(QWidget):
     
     def reset(self) -> None:
         """Reset all displays to initial state."""
+        self._last_eta_secs = -1
+        self._last_progress = None
         self.progress_bar.setValue(0)
         self.progress_bar.setMaximum(100)
         self.lbl_total.setText("Total: 0")
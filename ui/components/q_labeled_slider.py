@@ -8,9 +8,18 @@ class QLabeledSlider(QWidget):
     """
     value_changed = Signal(float)
 
+    # Changes smaller than this are float noise from the int<->float round trip
+    _EPSILON = 1e-9
+
     def __init__(self, label_text: str, from_val: float, to_val: float, 
                  initial_val: float = 0.0, step: float = 0.1, 
-                 left_label: str = None, right_label: str = None, parent=None):
+                 left_label: str = None, right_label: str = None, tick: float = None,
+                 parent=None):
+        """
+        `tick` (optional) is the value covered by one slider position while dragging.
+        Coarser ticks mean fewer value_changed emissions per drag; the spinbox keeps
+        full precision for typed values.
+        """
         super().__init__(parent)
         
         # Main Layout: Vertical to stack (Slider+Value) over (Helper Labels)
@@ -29,7 +38,11 @@ class QLabeledSlider(QWidget):
         
         # Slider
         self.slider = QSlider(Qt.Horizontal)
-        self.scale_factor = 100 if step < 1 else 10 # Increase precision for step=1
+        if tick:
+            self.scale_factor = round(1 / tick)
+        else:
+            self.scale_factor = 100 if step < 1 else 10 # Increase precision for step=1
+        self._inv_scale = 1.0 / self.scale_factor
         self.slider.setRange(int(from_val * self.scale_factor), int(to_val * self.scale_factor))
         self.slider.setValue(int(initial_val * self.scale_factor))
         
@@ -40,6 +53,9 @@ class QLabeledSlider(QWidget):
         self.spinbox.setSingleStep(step)
         self.spinbox.setValue(initial_val)
         
+        # Single source of truth; slider and spinbox are just views of it
+        self._value = self.spinbox.value()
+        
         self.top_layout.addWidget(self.label)
         self.top_layout.addWidget(self.slider)
         self.top_layout.addWidget(self.spinbox)
@@ -69,16 +85,21 @@ class QLabeledSlider(QWidget):
         self.spinbox.valueChanged.connect(self._on_spinbox_change)
         
     def _on_slider_change(self, val):
-        float_val = val / self.scale_factor
+        float_val = val * self._inv_scale
+        if abs(float_val - self._value) < self._EPSILON:
+            return
         self.spinbox.blockSignals(True)
         self.spinbox.setValue(float_val)
         self.spinbox.blockSignals(False)
-        self.value_changed.emit(float_val)
+        self._value = self.spinbox.value()  # Spinbox rounding to its decimals
+        self.value_changed.emit(self._value)
         
     def _on_spinbox_change(self, val):
-        int_val = int(val * self.scale_factor)
+        if abs(val - self._value) < self._EPSILON:
+            return
+        self._value = val
         self.slider.blockSignals(True)
-        self.slider.setValue(int_val)
+        self.slider.setValue(int(val * self.scale_factor))
         self.slider.blockSignals(False)
         self.value_changed.emit(val)
 
@@ -86,4 +107,4 @@ class QLabeledSlider(QWidget):
         self.spinbox.setValue(val)
         
     def get_value(self):
-        return self.spinbox.value()
+        return self._value
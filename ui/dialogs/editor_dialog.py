@@ -1,4 +1,8 @@
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QHBoxLayout, QPushButton, QLabel
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QPlainTextEdit, QHBoxLayout, QPushButton, QLabel
+from typing import Optional
+
+# Reused across edits; building the text editor per chunk edit is the slow part
+_EDITOR_SINGLETON = None
 
 class EditorDialog(QDialog):
     """
@@ -15,7 +19,7 @@ class EditorDialog(QDialog):
         
         layout.addWidget(QLabel("Edit Text Content:"))
         
-        self.text_edit = QTextEdit()
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setPlainText(initial_text)
         layout.addWidget(self.text_edit)
         
@@ -32,6 +36,27 @@ class EditorDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
         layout.addLayout(btn_layout)
         
+    @classmethod
+    def show_for(cls, initial_text="", parent=None, title="Edit Text") -> Optional[str]:
+        """
+        Shows the shared editor for `parent` and returns the edited text, or None if cancelled.
+        """
+        global _EDITOR_SINGLETON
+        dlg = _EDITOR_SINGLETON
+        try:
+            reusable = dlg is not None and dlg.parent() is parent
+        except RuntimeError:  # Qt object already deleted along with its old parent
+            reusable = False
+        
+        if reusable:
+            dlg.text_edit.setPlainText(initial_text)
+            dlg.setWindowTitle(title)
+            dlg.result_text = initial_text
+        else:
+            dlg = _EDITOR_SINGLETON = cls(initial_text, parent, title)
+        
+        return dlg.result_text if dlg.exec() else None
+        
     def accept(self):
         self.result_text = self.text_edit.toPlainText()
         super().accept()
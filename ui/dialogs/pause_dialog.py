@@ -2,16 +2,20 @@
 ui/dialogs/pause_dialog.py
 
 Custom dialog for inserting or editing a pause item.
-Shows a spinbox (default 500ms) plus three quick-apply buttons
+Shows a duration field (default 500ms) plus three quick-apply buttons
 that commit immediately without needing to press OK.
 """
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QSpinBox, QPushButton, QDialogButtonBox
+    QLineEdit, QPushButton, QDialogButtonBox
 )
+from PySide6.QtGui import QIntValidator
 from PySide6.QtCore import Qt
-from typing import Optional
+from typing import Callable, Optional
+
+# Pauses are inserted one at a time, often many in a row; build the dialog once.
+_PAUSE_SINGLETON = None
 
 
 class PauseDialog(QDialog):
@@ -19,18 +23,23 @@ class PauseDialog(QDialog):
     Dialog for selecting a pause duration.
 
     Quick-insert buttons (1000, 1500, 2000 ms) accept the dialog immediately
-    without requiring the user to press OK.  The spin-box defaults to 500 ms
-    and still requires an explicit OK press.
+    without requiring the user to press OK.  The duration field defaults to
+    500 ms and still requires an explicit OK press.
     """
 
     QUICK_DURATIONS = [1000, 1500, 2000]
+    MIN_MS = 100
+    MAX_MS = 10000
 
     def __init__(self, initial_ms: int = 500, parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Insert Pause")
         self.setMinimumWidth(240)
         self._result_ms: Optional[int] = None
+        self._initial_ms = initial_ms
+        self._callback: Optional[Callable[[Optional[int]], None]] = None
         self._build_ui(initial_ms)
+        self.finished.connect(self._on_finished)
 
     # ------------------------------------------------------------------
     # Public API
@@ -41,15 +50,44 @@ class PauseDialog(QDialog):
         """Returns the chosen duration in ms, or None if cancelled."""
         return self._result_ms
 
+    @staticmethod
+    def request_duration(callback: Callable[[Optional[int]], None],
+                         initial_ms: int = 500, parent=None) -> None:
+        """
+        Shows the dialog window-modally and returns immediately.
+        `callback(duration_ms)` runs when it closes (None if cancelled).
+        Preferred over get_duration(): no nested event loop.
+        """
+        dlg = PauseDialog._shared(initial_ms, parent)
+        dlg._callback = callback
+        dlg.open()
+
     @staticmethod
     def get_duration(initial_ms: int = 500, parent=None) -> Optional[int]:
         """
-        Convenience factory.  Shows the dialog and returns the duration or None.
+        Blocking convenience factory.  Shows the dialog with exec() (nested event
+        loop) and returns the duration or None.  Only for callers that must block.
         """
-        dlg = PauseDialog(initial_ms=initial_ms, parent=parent)
+        dlg = PauseDialog._shared(initial_ms, parent)
         dlg.exec()
         return dlg.duration_ms
 
+    @staticmethod
+    def _shared(initial_ms: int, parent) -> "PauseDialog":
+        """Returns the dialog for `parent`, reusing the previous one when possible."""
+        global _PAUSE_SINGLETON
+        dlg = _PAUSE_SINGLETON
+        try:
+            reusable = dlg is not None and dlg.parent() is parent
+        except RuntimeError:  # Qt object already deleted along with its old parent
+            reusable = False
+
+        if reusable:
+            dlg._reset(initial_ms)
+        else:
+            dlg = _PAUSE_SINGLETON = PauseDialog(initial_ms=initial_ms, parent=parent)
+        return dlg
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -60,11 +98,9 @@ class PauseDialog(QDialog):
 
         layout.addWidget(QLabel("Duration (ms):"))
 
-        self._spin = QSpinBox()
-        self._spin.setRange(100, 10000)
-        self._spin.setSingleStep(50)
-        self._spin.setValue(initial_ms)
-        self._spin.setSuffix(" ms")
+        # Plain validated line edit: far fewer child objects than a QSpinBox
+        self._spin = QLineEdit(str(initial_ms))
+        self._spin.setValidator(QIntValidator(self.MIN_MS, self.MAX_MS, self))
         layout.addWidget(self._spin)
 
         # Quick-insert buttons row
@@ -72,8 +108,9 @@ class PauseDialog(QDialog):
         for ms in self.QUICK_DURATIONS:
             btn = QPushButton(str(ms))
             btn.setToolTip(f"Insert {ms} ms pause immediately")
-            # Capture ms by default-argument binding
-            btn.clicked.connect(lambda _checked, v=ms: self._accept_quick(v))
+            # One shared slot for all quick buttons; the value rides on the button
+            btn.setProperty("ms", ms)
+            btn.clicked.connect(self._on_quick)
             quick_row.addWidget(btn)
         layout.addLayout(quick_row)
 
@@ -86,12 +123,34 @@ class PauseDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    def _reset(self, initial_ms: int) -> None:
+        """Prepares a reused dialog for another prompt."""
+        self._result_ms = None
+        self._callback = None
+        self._initial_ms = initial_ms
+        self._spin.setText(str(initial_ms))
+        self._spin.selectAll()
+
+    def _on_finished(self, _result: int) -> None:
+        """Delivers the result to a request_duration() callback, if one is waiting."""
+        callback, self._callback = self._callback, None
+        if callback is not None:
+            callback(self._result_ms)
+
+    def _on_quick(self) -> None:
+        """Slot for the quick-insert buttons; reads the duration off the sender."""
+        self._accept_quick(int(self.sender().property("ms")))
+
     def _accept_quick(self, ms: int) -> None:
         """Accepts the dialog immediately with the given quick-insert value."""
         self._result_ms = ms
         self.accept()
 
     def _accept_spin(self) -> None:
-        """Accepts the dialog using the current spinbox value."""
-        self._result_ms = self._spin.value()
+        """Accepts the dialog using the current field value (clamped to the valid range)."""
+        # The validator accepts locale-formatted input ("1,000"), so parse it the same way
+        ms, ok = self._spin.validator().locale().toInt(self._spin.text())
+        if not ok:
+            ms = self._initial_ms
+        self._result_ms = max(self.MIN_MS, min(self.MAX_MS, ms))
         self.accept()
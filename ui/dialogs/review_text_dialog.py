@@ -1,6 +1,25 @@
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QHBoxLayout, QPushButton, QLabel
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QPlainTextEdit, QHBoxLayout, QPushButton, QLabel,
+                               QPlainTextDocumentLayout)
+from PySide6.QtGui import QTextDocument, QTextCursor
+from PySide6.QtCore import QTimer
+from collections import OrderedDict
+from typing import Optional
+import hashlib
+
+# Reused across imports; see show_for()
+_REVIEW_SINGLETON = None
 
 class ReviewTextDialog(QDialog):
+    # Text hash -> already-parsed QTextDocument, so re-reviewing the same
+    # extraction (cancel, then re-open) skips the full setPlainText parse.
+    # Bounded by count and by total characters, so a few whole books can't stay
+    # resident for the life of the process; the newest document is always kept.
+    _doc_cache = OrderedDict()
+    _DOC_CACHE_MAX = 4
+    _DOC_CACHE_MAX_CHARS = 2_000_000
+    # Texts longer than this are streamed in over several event-loop turns
+    _FILL_SLICE = 64 * 1024
+
     def __init__(self, text, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Review and Edit Text")
@@ -15,8 +34,16 @@ class ReviewTextDialog(QDialog):
         lbl = QLabel("Review extracted text before processing:")
         layout.addWidget(lbl)
         
-        self.editor = QTextEdit()
-        self.editor.setPlainText(self.text)
+        # Plain-text editor: block layout only, much cheaper than QTextEdit on whole books
+        self.editor = QPlainTextEdit()
+        self._blank_doc = self._new_document()  # Shown between uses
+        self._fill_doc = None  # Document being streamed in (not yet cached)
+        self._fill_pos = 0
+        self._fill_timer = QTimer(self)
+        self._fill_timer.setSingleShot(True)
+        self._fill_timer.setInterval(0)
+        self._fill_timer.timeout.connect(self._fill_text)
+        self._load_text(self.text)
         layout.addWidget(self.editor)
 
         btn_layout = QHBoxLayout()
@@ -33,6 +60,111 @@ class ReviewTextDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
         layout.addLayout(btn_layout)
 
+    @classmethod
+    def show_for(cls, text, parent=None) -> Optional[str]:
+        """
+        Shows the shared review dialog for `parent` and returns the edited text, or None if cancelled.
+        """
+        global _REVIEW_SINGLETON
+        dlg = _REVIEW_SINGLETON
+        try:
+            reusable = dlg is not None and dlg.parent() is parent
+        except RuntimeError:  # Qt object already deleted along with its old parent
+            reusable = False
+        
+        if reusable:
+            dlg.text = text
+            dlg.result_text = None
+            dlg._load_text(text)
+        else:
+            dlg = _REVIEW_SINGLETON = cls(text, parent)
+        
+        accepted = dlg.exec()
+        result = dlg.result_text if accepted else None
+        dlg.text = ""
+        dlg._release_text()
+        return result
+
+    def _load_text(self, text):
+        """Shows `text`, reusing a cached document when this exact text was reviewed before."""
+        self._stop_fill()
+        cache = ReviewTextDialog._doc_cache
+        self._doc_key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        
+        doc = cache.get(self._doc_key)
+        if doc is not None:
+            cache.move_to_end(self._doc_key)
+            self.editor.setDocument(doc)
+            return
+        
+        doc = self._new_document()
+        if len(text) <= self._FILL_SLICE:
+            doc.setPlainText(text)
+            self.editor.setDocument(doc)
+            self._cache_document(doc)
+            return
+        
+        # Big book: let the dialog paint first, then append slices on the event loop.
+        # Read-only + no undo while filling so the user can't interleave edits.
+        doc.setUndoRedoEnabled(False)
+        self.editor.setDocument(doc)
+        self.editor.setReadOnly(True)
+        self._fill_doc = doc
+        self._fill_pos = 0
+        self._fill_timer.start()
+
+    def _fill_text(self, limit=None):
+        """Appends the next slice (or up to `limit` chars) of the text being streamed in."""
+        if self._fill_doc is None:
+            return
+        end = self._fill_pos + (limit or self._FILL_SLICE)
+        cursor = QTextCursor(self._fill_doc)
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(self.text[self._fill_pos:end])
+        self._fill_pos = end
+        
+        if end < len(self.text):
+            self._fill_timer.start()
+            return
+        
+        doc, self._fill_doc = self._fill_doc, None
+        doc.setUndoRedoEnabled(True)
+        doc.setModified(False)
+        self.editor.setReadOnly(False)
+        self._cache_document(doc)
+
+    def _stop_fill(self):
+        """Abandons any in-progress fill; the partial document is never cached."""
+        self._fill_timer.stop()
+        self._fill_doc = None
+        self.editor.setReadOnly(False)
+
+    def _cache_document(self, doc):
+        cache = ReviewTextDialog._doc_cache
+        cache[self._doc_key] = doc
+        # Called after the editor is attached, so it never points at a freed document
+        total = sum(d.characterCount() for d in cache.values())
+        while len(cache) > 1 and (len(cache) > self._DOC_CACHE_MAX or total > self._DOC_CACHE_MAX_CHARS):
+            _, evicted = cache.popitem(last=False)
+            total -= evicted.characterCount()
+
+    def _new_document(self):
+        """QPlainTextEdit only accepts documents using the plain-text layout."""
+        doc = QTextDocument()
+        doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+        doc.setDefaultFont(self.editor.font())
+        return doc
+
+    def _release_text(self):
+        """Detaches the document; edited ones are dropped since they no longer match their key."""
+        self._stop_fill()
+        doc = self.editor.document()
+        self.editor.setDocument(self._blank_doc)
+        if doc.isModified():
+            ReviewTextDialog._doc_cache.pop(self._doc_key, None)
+
     def accept(self):
+        if self._fill_doc is not None:
+            self._fill_text(limit=len(self.text))  # Confirmed before streaming finished
         self.result_text = self.editor.toPlainText()
         super().accept()
@@ -4,8 +4,8 @@ from PySide6.QtWidgets import (
     QStyledItemDelegate, QStyle, QApplication, QStyleOptionViewItem
 )
 from PySide6.QtGui import QColor, QBrush, QPalette
-from PySide6.QtCore import Qt, Signal, Slot, QModelIndex, QRect, QEvent, QAbstractListModel
-from typing import Optional, List, Dict, Any
+from PySide6.QtCore import Qt, Signal, Slot, QModelIndex, QRect, QEvent, QAbstractListModel, QTimer
+from typing import Optional, List, Dict, Any, Set
 from core.state import AppState
 from core.services.generation_service import GenerationService
 from core.services.chapter_service import ChapterService
@@ -17,15 +17,23 @@ class ChapterModel(QAbstractListModel):
         self.app_state = app_state
         self.logic = ChapterService()
         self._chapters: List[Dict[str, Any]] = []
-        self._checked_state: Dict[int, bool] = {} # Map original_idx -> is_checked
+        # Row labels, formatted on first paint: only the visible rows ever pay for it
+        self._labels: List[Optional[str]] = []
+        self._checked_rows: Set[int] = set()  # Rows whose checkbox is ticked
         self.refresh()
 
     def refresh(self):
-        self.beginResetModel()
         # Detect chapters from current sentences
-        self._chapters = self.logic.detect_chapters(self.app_state.sentences)
-        # Reset checked state on refresh? Or try to preserve? For safety, reset.
-        self._checked_state = {}
+        chapters = self.logic.detect_chapters(self.app_state.sentences)
+        if chapters == self._chapters:
+            # Edits that didn't move a heading: rows, labels and checks all still hold
+            return
+        
+        self.beginResetModel()
+        self._chapters = chapters
+        self._labels = [None] * len(chapters)
+        # Rows may now be different chapters, so checks keyed by row are reset
+        self._checked_rows = set()
         self.endResetModel()
 
     def rowCount(self, parent=QModelIndex()) -> int:
@@ -35,15 +43,19 @@ class ChapterModel(QAbstractListModel):
         if not index.isValid() or not (0 <= index.row() < len(self._chapters)):
             return None
         
-        chapter = self._chapters[index.row()]
+        row = index.row()
         
         if role == Qt.DisplayRole:
-            return f"📑 {chapter['title']} (Sentences {chapter['start_idx']+1}-{chapter['end_idx']+1})"
+            label = self._labels[row]
+            if label is None:
+                chapter = self._chapters[row]
+                label = self._labels[row] = f"📑 {chapter['title']} (Sentences {chapter['start_idx']+1}-{chapter['end_idx']+1})"
+            return label
             
         if role == Qt.CheckStateRole:
             # We map row index to check state.
             # Ideally we map absolute chapter index, but row index is fine if we clear on refresh.
-            return Qt.Checked if self._checked_state.get(index.row(), False) else Qt.Unchecked
+            return Qt.Checked if row in self._checked_rows else Qt.Unchecked
             
         return None
 
@@ -51,10 +63,24 @@ class ChapterModel(QAbstractListModel):
         if not index.isValid() or role != Qt.CheckStateRole:
             return False
             
-        self._checked_state[index.row()] = (value == Qt.Checked)
+        if value == Qt.Checked:
+            self._checked_rows.add(index.row())
+        else:
+            self._checked_rows.discard(index.row())
         self.dataChanged.emit(index, index, [role])
         return True
 
+    def set_rows_checked(self, rows, checked: bool = True) -> None:
+        """Checks/unchecks many rows with a single dataChanged (one repaint, not one per row)."""
+        rows = [r for r in rows if 0 <= r < len(self._chapters)]
+        if not rows:
+            return
+        if checked:
+            self._checked_rows.update(rows)
+        else:
+            self._checked_rows.difference_update(rows)
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0), [Qt.CheckStateRole])
+
     def flags(self, index):
         if not index.isValid():
             return Qt.NoItemFlags
@@ -62,7 +88,7 @@ class ChapterModel(QAbstractListModel):
 
     def get_selected_indices(self) -> List[int]:
         """Returns the list of INDICES in the chapter list that are checked."""
-        return [row for row, checked in self._checked_state.items() if checked]
+        return sorted(self._checked_rows)
 
     def get_chapter_index(self, row: int) -> int:
         """Returns the start sentence index for the chapter at the given row."""
@@ -73,6 +99,9 @@ class ChapterModel(QAbstractListModel):
 class ChapterDelegate(QStyledItemDelegate):
     jump_clicked = Signal(int)
 
+    # Built once instead of on every row paint
+    _JUMP_BRUSH = QBrush(QColor("#1A6FA8"))  # Blue to distinguish from Generate (orange)
+
     def _get_check_rect(self, option, widget):
         style = widget.style() if widget else QApplication.style()
         check_rect = style.subElementRect(QStyle.SE_ItemViewItemCheckIndicator, option, widget)
@@ -136,8 +165,7 @@ class ChapterDelegate(QStyledItemDelegate):
 
         # 6. Draw "JUMP" Button
         # Background
-        btn_color = QColor("#1A6FA8")  # Blue to distinguish from Generate (orange)
-        painter.setBrush(QBrush(btn_color))
+        painter.setBrush(self._JUMP_BRUSH)
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(button_rect, 4, 4)
         
@@ -191,6 +219,12 @@ class ChaptersView(QWidget):
         self.model = ChapterModel(app_state)
         self.gen_service: Optional[GenerationService] = None
         self.playlist_service = None  # Injected later via set_playlist_service()
+        self._chapters_stale = False  # Structure changed while hidden; rescan on next show
+        # Coalesces a burst of edits made while the tab is visible into one rescan
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._refresh_now)
 
         self.setup_ui()
 
@@ -227,6 +261,8 @@ class ChaptersView(QWidget):
         self.list_view = QListView()
         self.list_view.setModel(self.model)
         self.list_view.setAlternatingRowColors(True)
+        # Every row is one delegate-painted line: let the view skip per-row sizeHint() on reset
+        self.list_view.setUniformItemSizes(True)
         
 
         # Palette set in update_theme() called at end of setup
@@ -332,9 +368,25 @@ class ChaptersView(QWidget):
 
     def showEvent(self, event) -> None:
         """"""
+        if self._chapters_stale:
+            self._refresh_now()
         self.refresh_gpu_status()
         super().showEvent(event)
 
+    def request_refresh(self) -> None:
+        """
+        Rescans chapters once the event loop is idle if the tab is on screen,
+        otherwise on the next show. Either way a burst of edits costs one scan.
+        """
+        self._chapters_stale = True
+        if self.isVisible():
+            self._refresh_timer.start()
+
+    def _refresh_now(self) -> None:
+        self._refresh_timer.stop()
+        self._chapters_stale = False
+        self.model.refresh()
+
     def update_theme(self, theme_name: str) -> None:
         """
         Updates the list palette based on whether the theme is dark or light.
@@ -369,14 +421,10 @@ class ChaptersView(QWidget):
             
 
     def select_all(self) -> None:
-        for i in range(self.model.rowCount()):
-            idx = self.model.index(i, 0)
-            self.model.setData(idx, Qt.Checked, Qt.CheckStateRole)
+        self.model.set_rows_checked(range(self.model.rowCount()), True)
 
     def deselect_all(self) -> None:
-        for i in range(self.model.rowCount()):
-            idx = self.model.index(i, 0)
-            self.model.setData(idx, Qt.Unchecked, Qt.CheckStateRole)
+        self.model.set_rows_checked(range(self.model.rowCount()), False)
 
     def check_highlighted(self) -> None:
         """Checks the checkboxes for all currently highlighted rows in the list."""
@@ -385,11 +433,7 @@ class ChaptersView(QWidget):
             QMessageBox.information(self, "Info", "No rows highlighted. Click to highlight rows first.")
             return
             
-        count = 0
-        for index in selected_indexes:
-            # Check the box
-            self.model.setData(index, Qt.Checked, Qt.CheckStateRole)
-            count += 1
+        self.model.set_rows_checked([index.row() for index in selected_indexes], True)
 
     def set_generation_service(self, gen_service: GenerationService) -> None:
         self.gen_service = gen_service
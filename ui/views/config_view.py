@@ -31,6 +31,18 @@ class ConfigView(QWidget):
         # Block signals to prevent feedback loops during update
         self.spin_buf_before.blockSignals(True)
         self.spin_buf_after.blockSignals(True)
+        
+        try:
+            self.spin_buf_before.setValue(s.chapter_buffer_before_ms)
+            self.spin_buf_after.setValue(s.chapter_buffer_after_ms)
+        finally:
+            self.spin_buf_before.blockSignals(False)
+            self.spin_buf_after.blockSignals(False)
+        
+        # Not built yet: the first expand reads the current state anyway
+        if not self._advanced_built:
+            return
+        
         self.gpu_edit.blockSignals(True)
         self.order_combo.blockSignals(True)
         self.seed_spin.blockSignals(True)
@@ -42,8 +54,6 @@ class ConfigView(QWidget):
         self.auto_loop_chk.blockSignals(True)
         
         try:
-            self.spin_buf_before.setValue(s.chapter_buffer_before_ms)
-            self.spin_buf_after.setValue(s.chapter_buffer_after_ms)
             self.gpu_edit.setText(s.target_gpus)
             self.order_combo.setCurrentText(s.generation_order)
             self.seed_spin.setValue(s.master_seed)
@@ -54,8 +64,6 @@ class ConfigView(QWidget):
             self.auto_loop_chk.setChecked(getattr(self.state, 'auto_regen_main', False))
             self.chk_watermark.setChecked(s.disable_watermark)
         finally:
-            self.spin_buf_before.blockSignals(False)
-            self.spin_buf_after.blockSignals(False)
             self.gpu_edit.blockSignals(False)
             self.order_combo.blockSignals(False)
             self.seed_spin.blockSignals(False)
@@ -66,14 +74,26 @@ class ConfigView(QWidget):
             self.auto_loop_chk.blockSignals(False)
             self.chk_watermark.blockSignals(False)
         
-    def _make_collapsible(self, group: 'QGroupBox', expanded: bool = True, state_key: str = None) -> None:
-        """Makes a QGroupBox collapse/expand when its title checkbox is toggled."""
+    def _make_collapsible(self, group: 'QGroupBox', expanded: bool = True, state_key: str = None,
+                          builder=None) -> None:
+        """
+        Makes a QGroupBox collapse/expand when its title checkbox is toggled.
+        `builder()` (optional) populates the group on first expand, so a group
+        that starts collapsed costs nothing until used.
+        """
         group.setCheckable(True)
         group.setChecked(expanded)
+        pending = [builder] if builder is not None else []
 
         def _toggle(checked: bool) -> None:
-            for child in group.findChildren(QWidget):
+            # Build and show/hide as one batch: a single relayout + repaint, not one per row
+            group.setUpdatesEnabled(False)
+            if checked and pending:
+                pending.pop()()
+            # Direct children only; nested widgets follow their parent's visibility
+            for child in group.findChildren(QWidget, options=Qt.FindDirectChildrenOnly):
                 child.setVisible(checked)
+            group.setUpdatesEnabled(True)
             if state_key and hasattr(self.state, state_key):
                 setattr(self.state, state_key, checked)
 
@@ -161,10 +181,42 @@ class ConfigView(QWidget):
         adv_group = QGroupBox("▾ Advanced Engine Configuration")
         a_layout = QFormLayout(adv_group)
         
-        # Load persisted group expansion state
+        # Load persisted group expansion state; contents (incl. the torch/CUDA probe) are built on first expand
+        self._advanced_built = False
         is_expanded = getattr(self.state, 'advanced_engine_expanded', False)
-        self._make_collapsible(adv_group, expanded=is_expanded, state_key='advanced_engine_expanded')
+        self._make_collapsible(adv_group, expanded=is_expanded, state_key='advanced_engine_expanded',
+                               builder=lambda: self._build_advanced(a_layout))
+        
+        layout.addWidget(adv_group)
 
+        # --- Group 4: Session Recovery ---
+        recovery_group = QGroupBox("Session Recovery")
+        r_layout = QVBoxLayout(recovery_group)
+
+        r_label = QLabel(
+            "If the application crashed mid-generation, use this to restore progress\n"
+            "from the crash-safe progress journal written during generation."
+        )
+        r_label.setWordWrap(True)
+        r_layout.addWidget(r_label)
+
+        btn_recover = QPushButton("🔄 Recover Session from Progress Journal")
+        btn_recover.setToolTip(
+            "Reads generation_progress.jsonl from the session folder and\n"
+            "re-links completed chunks. Successes are marked green; failures red."
+        )
+        btn_recover.clicked.connect(self._recover_session)
+        r_layout.addWidget(btn_recover)
+
+        layout.addWidget(recovery_group)
+
+        layout.addStretch()
+        
+    def _build_advanced(self, a_layout: QFormLayout) -> None:
+        """Populates the Advanced Engine Configuration group from the current state."""
+        settings = self.state.settings  # Bound once; read for every widget below
+        self._advanced_built = True
+        
         # GPU Device Handling (Dynamic Checkboxes)
         import torch
         self.gpu_checkboxes = []
@@ -175,7 +227,7 @@ class ConfigView(QWidget):
             gpu_layout = QVBoxLayout(gpu_group)
             
             # Parse existing setting (e.g. "cuda:0,cuda:1")
-            current_gpus = [g.strip() for g in self.state.settings.target_gpus.split(',')]
+            current_gpus = [g.strip() for g in settings.target_gpus.split(',')]
             
             for i in range(gpu_count):
                 gpu_name = f"cuda:{i}"
@@ -201,7 +253,7 @@ class ConfigView(QWidget):
         # Gen Order
         self.order_combo = QComboBox()
         self.order_combo.addItems(["linear", "random", "interleaved"])
-        self.order_combo.setCurrentText(self.state.settings.generation_order)
+        self.order_combo.setCurrentText(settings.generation_order)
         self.order_combo.currentTextChanged.connect(
             lambda t: setattr(self.state.settings, 'generation_order', t)
         )
@@ -211,7 +263,7 @@ class ConfigView(QWidget):
         self.seed_spin = QSpinBox()
         self.seed_spin.setRange(-1, 2147483647)
         self.seed_spin.setSpecialValueText("Random (-1)")
-        self.seed_spin.setValue(self.state.settings.master_seed)
+        self.seed_spin.setValue(settings.master_seed)
         self.seed_spin.valueChanged.connect(
             lambda v: setattr(self.state.settings, 'master_seed', v)
         )
@@ -220,7 +272,7 @@ class ConfigView(QWidget):
         # Full Outputs
         self.outputs_spin = QSpinBox()
         self.outputs_spin.setRange(1, 100)
-        self.outputs_spin.setValue(self.state.settings.num_full_outputs)
+        self.outputs_spin.setValue(settings.num_full_outputs)
         self.outputs_spin.valueChanged.connect(
             lambda v: setattr(self.state.settings, 'num_full_outputs', v)
         )
@@ -229,7 +281,7 @@ class ConfigView(QWidget):
         # Max Retries
         self.retries_spin = QSpinBox()
         self.retries_spin.setRange(0, 50)
-        self.retries_spin.setValue(self.state.settings.max_attempts)
+        self.retries_spin.setValue(settings.max_attempts)
         self.retries_spin.valueChanged.connect(
             lambda v: setattr(self.state.settings, 'max_attempts', v)
         )
@@ -240,13 +292,13 @@ class ConfigView(QWidget):
         
         self.chk_asr = QGroupBox("ASR Validation")
         self.chk_asr.setCheckable(True)
-        self.chk_asr.setChecked(self.state.settings.asr_validation_enabled)
+        self.chk_asr.setChecked(settings.asr_validation_enabled)
         self.chk_asr.toggled.connect(
             lambda c: setattr(self.state.settings, 'asr_validation_enabled', c)
         )
         # ASR Threshold inside logic
         asr_l = QFormLayout(self.chk_asr)
-        self.asr_thresh = QLabeledSlider("Acceptance Threshold", 0.1, 1.0, self.state.settings.asr_threshold)
+        self.asr_thresh = QLabeledSlider("Acceptance Threshold", 0.1, 1.0, settings.asr_threshold)
         self.asr_thresh.value_changed.connect(
              lambda v: setattr(self.state.settings, 'asr_threshold', v)
         )
@@ -266,39 +318,14 @@ class ConfigView(QWidget):
         chk_layout.addWidget(self.chk_asr)
         
         self.chk_watermark = QCheckBox("Disable Perth Watermark")
-        self.chk_watermark.setChecked(self.state.settings.disable_watermark)
+        self.chk_watermark.setChecked(settings.disable_watermark)
         self.chk_watermark.stateChanged.connect(
              lambda s: setattr(self.state.settings, 'disable_watermark', s == Qt.Checked or s == 2)
         )
         chk_layout.addWidget(self.chk_watermark)
 
         a_layout.addRow(chk_layout)
-        
-        layout.addWidget(adv_group)
-
-        # --- Group 4: Session Recovery ---
-        recovery_group = QGroupBox("Session Recovery")
-        r_layout = QVBoxLayout(recovery_group)
-
-        r_label = QLabel(
-            "If the application crashed mid-generation, use this to restore progress\n"
-            "from the crash-safe progress journal written during generation."
-        )
-        r_label.setWordWrap(True)
-        r_layout.addWidget(r_label)
-
-        btn_recover = QPushButton("🔄 Recover Session from Progress Journal")
-        btn_recover.setToolTip(
-            "Reads generation_progress.jsonl from the session folder and\n"
-            "re-links completed chunks. Successes are marked green; failures red."
-        )
-        btn_recover.clicked.connect(self._recover_session)
-        r_layout.addWidget(btn_recover)
 
-        layout.addWidget(recovery_group)
-
-        layout.addStretch()
-        
     def on_theme_changed(self, theme_name: str) -> None:
         """Apply theme immediately when combo changes."""
         try:
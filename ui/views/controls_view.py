@@ -1,11 +1,32 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QHBoxLayout, QGridLayout, 
                                QLineEdit, QLabel, QMessageBox, QInputDialog, QCheckBox)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 import logging
 import os
+from functools import partial
+from itertools import islice
 from ui.components.collapsible_frame import CollapsibleFrame
 from core.services.playlist_service import PlaylistService
 from core.services.generation_service import GenerationService
+from ui.dialogs.pause_dialog import PauseDialog
+from ui.dialogs.editor_dialog import EditorDialog
+from utils.text_processor import TextPreprocessor
+
+# (text, slot, css class, tooltip, row, col) for the "Chunk Editing & Status" grid
+EDIT_BUTTONS = (
+    ("✎ Edit", "_edit_text", "action", "Edit the text or properties of the selected item.", 0, 0),
+    ("➕ Text", "_insert_text", "action", "Insert a new text chunk below the selection.", 0, 1),
+    ("⏸ Pause", "_insert_pause", "action", "Insert a silent pause block below the selection.", 0, 2),
+    ("🤖 Auto Pause", "_auto_pause_action", "action", "Automatically wrap all chapters with pauses.", 0, 3),
+    ("📑 New Chap", "_insert_chapter", "action", "Insert a new Chapter Heading below the selection.", 0, 4),
+    ("➡️ Conv Chap", "_convert_to_chapter", "action", "Convert the selected item into a Chapter Heading.", 0, 5),
+    ("⚑ Flag", "_mark_current", "action", "Toggle flag on selected item(s) — flagged items can be regenerated in batch.", 1, 0),
+    ("➗ Split", "_split_chunk", "action", "Split the current text chunk into smaller sentences.", 1, 1),
+    ("🔗 Merge\nSelected", "_merge_selected", "action", "Merge multiple selected contiguous chunks into one.", 1, 2),
+    ("✓ Passed", "_mark_passed", "success", "Manually mark item as Passed (Green).", 1, 3),
+    ("🔄 Reset", "_reset_gen", "warning", "Reset generation status and clear all audio/stats.", 1, 4),
+    ("❌ Delete", "_delete_items", "danger", "Delete selected items.", 1, 5),
+)
 
 class ControlsView(QWidget):
     """
@@ -14,6 +35,9 @@ class ControlsView(QWidget):
     """
     structure_changed = Signal() # Emitted when chapters are added/converted
 
+    # Shared style for the ◄ / ► search buttons (one string, not one per button)
+    _SEARCH_NAV_STYLE = "padding: 2px; font-size: 16px; font-weight: bold;"
+
     def __init__(self, services, playlist_view, parent=None):
         super().__init__(parent)
         self.services = services # Dict {playlist: PlaylistService, generation: GenerationService}
@@ -23,7 +47,12 @@ class ControlsView(QWidget):
         self.playlist_service = services.get('playlist')
         self.audio_service = services.get('audio') # Injected by MainWindow
         
-        self.setup_ui()
+        # Build all groups with painting suspended so layout/paint happen once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            self.setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
         
     def setup_ui(self):
         main_layout = QVBoxLayout(self)
@@ -40,9 +69,10 @@ class ControlsView(QWidget):
         self._setup_editing(self.edit_group)
 
         # --- Group 3: Batch Fix & Regeneration ---
-        self.batch_group = CollapsibleFrame("Batch Fix & Regeneration", start_open=False)
+        # Starts closed, so its widgets are only built the first time it's opened
+        self.batch_group = CollapsibleFrame("Batch Fix & Regeneration", start_open=False,
+                                            builder=self._setup_batch)
         main_layout.addWidget(self.batch_group)
-        self._setup_batch(self.batch_group)
         
         main_layout.addStretch()
 
@@ -59,24 +89,24 @@ class ControlsView(QWidget):
         layout.addWidget(btn_play_from, 0, 2, 1, 2)
         
         # Row 1: Move + Success / Error Navigation (restored as original)
-        btn_up = QPushButton("▲ Move Up"); btn_up.clicked.connect(lambda: self._move_items(-1))
-        btn_down = QPushButton("▼ Move Down"); btn_down.clicked.connect(lambda: self._move_items(1))
+        btn_up = QPushButton("▲ Move Up"); btn_up.clicked.connect(partial(self._move_items, -1))
+        btn_down = QPushButton("▼ Move Down"); btn_down.clicked.connect(partial(self._move_items, 1))
         
         btn_prev_success = QPushButton("◄ Prev Success")
         btn_prev_success.setStyleSheet("background-color: #90EE90; color: black; font-weight: bold;")
-        btn_prev_success.clicked.connect(lambda: self._nav_success(-1))
+        btn_prev_success.clicked.connect(partial(self._nav_success, -1))
 
         btn_next_success = QPushButton("Next Success ►")
         btn_next_success.setStyleSheet("background-color: #90EE90; color: black; font-weight: bold;")
-        btn_next_success.clicked.connect(lambda: self._nav_success(1))
+        btn_next_success.clicked.connect(partial(self._nav_success, 1))
 
         btn_prev_err = QPushButton("◄ Prev Error")
         btn_prev_err.setStyleSheet("background-color: #FFB6C1; color: black; font-weight: bold;")
-        btn_prev_err.clicked.connect(lambda: self._nav_error(-1))
+        btn_prev_err.clicked.connect(partial(self._nav_error, -1))
 
         btn_next_err = QPushButton("Next Error ►")
         btn_next_err.setStyleSheet("background-color: #FFB6C1; color: black; font-weight: bold;")
-        btn_next_err.clicked.connect(lambda: self._nav_error(1))
+        btn_next_err.clicked.connect(partial(self._nav_error, 1))
 
         layout.addWidget(btn_up, 1, 0)
         layout.addWidget(btn_down, 1, 1)
@@ -94,16 +124,23 @@ class ControlsView(QWidget):
         self.search_edit.setMinimumWidth(150)
         self.search_edit.setProperty("class", "search-box")
         self.search_edit.returnPressed.connect(self._search)
+        # Live search: restart a short single-shot timer on each keystroke so the
+        # O(N) scan runs once the user pauses typing, not once per key.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._live_search)
+        self.search_edit.textChanged.connect(self._on_search_text_changed)
         s_layout.addWidget(self.search_edit)
         
         btn_s_prev = QPushButton("◄")
         btn_s_prev.setFixedWidth(40)
-        btn_s_prev.setStyleSheet("padding: 2px; font-size: 16px; font-weight: bold;")
+        btn_s_prev.setStyleSheet(self._SEARCH_NAV_STYLE)
         btn_s_prev.clicked.connect(self._search_prev)
         
         btn_s_next = QPushButton("►")
         btn_s_next.setFixedWidth(40)
-        btn_s_next.setStyleSheet("padding: 2px; font-size: 16px; font-weight: bold;")
+        btn_s_next.setStyleSheet(self._SEARCH_NAV_STYLE)
         btn_s_next.clicked.connect(self._search_next)
         
         s_layout.addWidget(btn_s_prev)
@@ -140,74 +177,13 @@ class ControlsView(QWidget):
     def _setup_editing(self, group):
         layout = QGridLayout()
         
-        # Row 0: Editing & Insertions
-        # Buttons: Edit, +Text, Pause, AutoPause, +Chap, Conv
-        
-        btn_edit = QPushButton("✎ Edit"); btn_edit.clicked.connect(self._edit_text)
-        btn_edit.setProperty("class", "action")
-        btn_edit.setToolTip("Edit the text or properties of the selected item.")
-
-        btn_ins_txt = QPushButton("➕ Text"); btn_ins_txt.clicked.connect(self._insert_text)
-        btn_ins_txt.setProperty("class", "action")
-        btn_ins_txt.setToolTip("Insert a new text chunk below the selection.")
-
-        btn_ins_pause = QPushButton("⏸ Pause"); btn_ins_pause.clicked.connect(self._insert_pause)
-        btn_ins_pause.setProperty("class", "action")
-        btn_ins_pause.setToolTip("Insert a silent pause block below the selection.")
-        
-        # NEW: Auto Pause
-        btn_auto_pause = QPushButton("🤖 Auto Pause"); btn_auto_pause.clicked.connect(self._auto_pause_action)
-        btn_auto_pause.setProperty("class", "action")
-        btn_auto_pause.setToolTip("Automatically wrap all chapters with pauses.")
-        
-        btn_ins_chap = QPushButton("📑 New Chap"); btn_ins_chap.clicked.connect(self._insert_chapter)
-        btn_ins_chap.setProperty("class", "action")
-        btn_ins_chap.setToolTip("Insert a new Chapter Heading below the selection.")
-
-        btn_conv_chap = QPushButton("➡️ Conv Chap"); btn_conv_chap.clicked.connect(self._convert_to_chapter)
-        btn_conv_chap.setProperty("class", "action")
-        btn_conv_chap.setToolTip("Convert the selected item into a Chapter Heading.")
-        
-        # Layout 6 columns
-        layout.addWidget(btn_edit, 0, 0)
-        layout.addWidget(btn_ins_txt, 0, 1)
-        layout.addWidget(btn_ins_pause, 0, 2)
-        layout.addWidget(btn_auto_pause, 0, 3)
-        layout.addWidget(btn_ins_chap, 0, 4)
-        layout.addWidget(btn_conv_chap, 0, 5)
-        
-        # Row 1: Markers, Status & Split
-        btn_mark = QPushButton("⚑ Flag"); btn_mark.clicked.connect(self._mark_current)
-        btn_mark.setProperty("class", "action")
-        btn_mark.setToolTip("Toggle flag on selected item(s) — flagged items can be regenerated in batch.")
-        
-        btn_split = QPushButton("➗ Split"); btn_split.clicked.connect(self._split_chunk)
-        btn_split.setProperty("class", "action")
-        btn_split.setToolTip("Split the current text chunk into smaller sentences.")
-        
-        btn_merge_sel = QPushButton("🔗 Merge\nSelected"); btn_merge_sel.clicked.connect(self._merge_selected)
-        btn_merge_sel.setProperty("class", "action")
-        btn_merge_sel.setToolTip("Merge multiple selected contiguous chunks into one.")
-        
-        btn_pass = QPushButton("✓ Passed"); btn_pass.clicked.connect(self._mark_passed)
-        btn_pass.setProperty("class", "success")
-        btn_pass.setToolTip("Manually mark item as Passed (Green).")
-        
-        btn_reset = QPushButton("🔄 Reset"); btn_reset.clicked.connect(self._reset_gen)
-        btn_reset.setProperty("class", "warning")
-        btn_reset.setToolTip("Reset generation status and clear all audio/stats.")
-        
-        btn_del = QPushButton("❌ Delete"); btn_del.clicked.connect(self._delete_items)
-        btn_del.setProperty("class", "danger")
-        btn_del.setToolTip("Delete selected items.")
-        
-        # 6 columns to balance
-        layout.addWidget(btn_mark, 1, 0)
-        layout.addWidget(btn_split, 1, 1)
-        layout.addWidget(btn_merge_sel, 1, 2)
-        layout.addWidget(btn_pass, 1, 3)
-        layout.addWidget(btn_reset, 1, 4)
-        layout.addWidget(btn_del, 1, 5)
+        # Row 0: Editing & Insertions / Row 1: Markers, Status & Split (6 columns each)
+        for text, slot, css_class, tip, row, col in EDIT_BUTTONS:
+            btn = QPushButton(text)
+            btn.clicked.connect(getattr(self, slot))
+            btn.setProperty("class", css_class)
+            btn.setToolTip(tip)
+            layout.addWidget(btn, row, col)
         
         group.add_layout(layout)
 
@@ -293,25 +269,14 @@ class ControlsView(QWidget):
         if not path:
              # 2. Try constructing default path (fallback)
              # Check for both "audio_{uuid}.wav" (New) and "sentence_{uuid}.wav" (Legacy)
-             uuid_str = item.get('uuid')
-             base_dir = os.path.join(os.getcwd(), "output", "wavs") # Or "Output_Pro/Session/..."?
-             # Better: Use saved session path if available?
              # For now, check standard output names relative to CWD
+             base_dir = os.path.join(os.getcwd(), "output", "wavs") # Or "Output_Pro/Session/..."?
+             path = self._find_fallback_audio(item.get('uuid'), base_dir)
              
-             candidates = [
-                 os.path.join(base_dir, f"audio_{uuid_str}.wav"),
-                 os.path.join(base_dir, f"sentence_{uuid_str}.wav"),
-                 # Also try finding it in the session specific folder if possible, but path *should* be saved.
-             ]
-             
-             for c in candidates:
-                 if os.path.exists(c):
-                     path = c
-                     print(f"DEBUG: Found fallback audio at: {path}", flush=True)
-                     break
-             
-             if not path:
-                  print(f"DEBUG: Fallback search failed. Checked: {candidates}", flush=True)
+             if path:
+                 print(f"DEBUG: Found fallback audio at: {path}", flush=True)
+             else:
+                 print(f"DEBUG: Fallback search failed in: {base_dir}", flush=True)
 
         if not path or not os.path.exists(path):
             # The app might be running from a subdir (e.g. execution/chatterboxPro), 
@@ -359,35 +324,34 @@ class ControlsView(QWidget):
         queue = []
         sentences = self.playlist_service.state.sentences
         
+        # Resolve CWD and the fallback dir once: abspath() would call getcwd() per item
+        cwd = os.getcwd()
+        fallback_dir = os.path.join(cwd, "output", "wavs")
+        # Loop-invariant lookups bound once; this walks the rest of the book
+        exists, join, normpath = os.path.exists, os.path.join, os.path.normpath
+        find_fallback = self._find_fallback_audio
+        enqueue = queue.append
+        
         # Iterate from selected index to end
-        for i in range(idx, len(sentences)):
-            item = sentences[i]
+        for item in islice(sentences, idx, None):
+            get = item.get
             
             # Handle Pauses
-            if item.get('is_pause'):
-                duration = item.get('duration', 0)
+            if get('is_pause'):
+                duration = get('duration', 0)
                 if duration > 0:
-                    queue.append({'type': 'pause', 'duration': duration})
+                    enqueue({'type': 'pause', 'duration': duration})
                 continue
                 
             # Handle Audio
-            path = item.get('audio_path')
+            path = get('audio_path')
             
             # If path missing, try fallback
             if not path:
-                uuid_str = item.get('uuid')
-                base_dir = os.path.join(os.getcwd(), "output", "wavs")
-                candidates = [
-                    os.path.join(base_dir, f"audio_{uuid_str}.wav"), 
-                    os.path.join(base_dir, f"sentence_{uuid_str}.wav")
-                ]
-                for c in candidates:
-                    if os.path.exists(c):
-                        path = c
-                        break
+                path = find_fallback(get('uuid'), fallback_dir)
             
-            if path and os.path.exists(path):
-                queue.append({'type': 'file', 'path': os.path.abspath(path)})
+            if path and exists(path):
+                enqueue({'type': 'file', 'path': normpath(join(cwd, path))})
         
         if not queue:
             QMessageBox.warning(self, "Playback", "No audio or pauses found starting from selection.")
@@ -399,6 +363,15 @@ class ControlsView(QWidget):
         else:
              QMessageBox.warning(self, "Error", "Audio Service disconnected.")
 
+    @staticmethod
+    def _find_fallback_audio(uuid_str, base_dir):
+        """Checks the new ("audio_") and legacy ("sentence_") wav names in base_dir."""
+        for prefix in ("audio_", "sentence_"):
+            candidate = os.path.join(base_dir, prefix + str(uuid_str) + ".wav")
+            if os.path.exists(candidate):
+                return candidate
+        return None
+
     def _get_selected_index(self):
         indices = self.playlist.get_selected_indices()
         return indices[0] if indices else -1
@@ -409,6 +382,10 @@ class ControlsView(QWidget):
     def _refresh(self):
         self.playlist.refresh()
 
+    def _refresh_rows(self, indices):
+        """Cheaper than _refresh() when only item flags changed: no model reset, selection kept."""
+        self.playlist.update_items(indices)
+
     def _edit_text(self):
         try:
             print("DEBUG: Edit Button Clicked!", flush=True)
@@ -430,25 +407,25 @@ class ControlsView(QWidget):
             
             # Pause items get the dedicated quick-insert dialog
             if item.get('is_pause'):
-                from ui.dialogs.pause_dialog import PauseDialog
                 old_dur = item.get('duration', 500)
-                new_dur = PauseDialog.get_duration(initial_ms=old_dur, parent=self)
-                if new_dur is not None and new_dur != old_dur:
-                    logging.info(f"Updating pause duration to {new_dur}")
-                    if self.playlist_service.edit_pause(idx, new_dur):
-                        self._refresh()
-                        self.playlist.list_view.viewport().update()
+
+                def _apply_pause(new_dur):
+                    if new_dur is not None and new_dur != old_dur:
+                        logging.info(f"Updating pause duration to {new_dur}")
+                        if self.playlist_service.edit_pause(idx, new_dur):
+                            self._refresh()
+                            self.playlist.list_view.viewport().update()
+
+                PauseDialog.request_duration(_apply_pause, initial_ms=old_dur, parent=self)
                 return
 
             # Normal Text Editing
             print("DEBUG: Attempting EditorDialog for Text...", flush=True)
             old_text = item.get('original_sentence', '')
             
-            from ui.dialogs.editor_dialog import EditorDialog
-            dlg = EditorDialog(old_text, self)
+            new_text = EditorDialog.show_for(old_text, self)
             
-            if dlg.exec():
-                new_text = dlg.result_text
+            if new_text is not None:
                 if new_text != old_text:
                     if self.playlist_service.edit_text(idx, new_text):
                         self._refresh()
@@ -496,12 +473,14 @@ class ControlsView(QWidget):
 
     def _insert_pause(self):
         idx = self._get_selected_index()
-        from ui.dialogs.pause_dialog import PauseDialog
-        dur = PauseDialog.get_duration(initial_ms=500, parent=self)
-        if dur is not None:
-            self.playlist_service.insert_item(idx, "[PAUSE]", is_pause=True, duration=dur)
-            self._refresh()
-            self.structure_changed.emit()
+
+        def _insert(dur):
+            if dur is not None:
+                self.playlist_service.insert_item(idx, "[PAUSE]", is_pause=True, duration=dur)
+                self._refresh()
+                self.structure_changed.emit()
+
+        PauseDialog.request_duration(_insert, initial_ms=500, parent=self)
 
     def _insert_chapter(self):
         idx = self._get_selected_index()
@@ -525,7 +504,7 @@ class ControlsView(QWidget):
         indices = self._get_selected_indices()
         if not indices: return
         self.playlist_service.toggle_selection_mark(indices)
-        self._refresh()
+        self._refresh_rows(indices)
 
     def _mark_passed(self):
         indices = self._get_selected_indices()
@@ -534,13 +513,13 @@ class ControlsView(QWidget):
             item = self.playlist_service.get_selected_item(i)
             item['tts_generated'] = 'yes' # Force pass
             item['marked'] = False
-        self._refresh()
+        self._refresh_rows(indices)
 
     def _reset_gen(self):
         indices = self._get_selected_indices()
         for i in indices:
             self.playlist_service.reset_item(i)
-        self._refresh()
+        self._refresh_rows(indices)
 
     def _delete_items(self):
         indices = self._get_selected_indices()
@@ -550,20 +529,21 @@ class ControlsView(QWidget):
             self._refresh()
             self.structure_changed.emit()
 
-    def _move_items(self, direction):
+    def _move_items(self, direction, *_):
+        # Wired via functools.partial; `*_` absorbs clicked()'s `checked` arg
         indices = self._get_selected_indices()
         if self.playlist_service.move_items(indices, direction):
             self._refresh()
             self.structure_changed.emit()
             # Restore selection (tricky due to re-indexing, service would need to return new indices)
 
-    def _nav_error(self, direction):
+    def _nav_error(self, direction, *_):
         idx = self._get_selected_index()
         next_idx = self.playlist_service.find_next_status(idx, direction, 'failed')
         if next_idx != -1:
             self.playlist.jump_to_row(next_idx)
 
-    def _nav_success(self, direction):
+    def _nav_success(self, direction, *_):
         """Navigate to next/previous successful chunk."""
         idx = self._get_selected_index()
         next_idx = self.playlist_service.find_next_status(idx, direction, 'yes')
@@ -571,7 +551,27 @@ class ControlsView(QWidget):
             self.playlist.jump_to_row(next_idx)
 
 
+    def reset_session_state(self):
+        """
+        Clears per-project transient state (search matches, pending live search).
+        The view itself is built once and kept across project loads.
+        """
+        self._search_timer.stop()
+        self.matches = []
+        self.match_idx = 0
+
+    def _on_search_text_changed(self, _text):
+        self._search_timer.start()
+
+    def _live_search(self):
+        """Debounced search-as-you-type; blank queries just clear the matches."""
+        if not self.search_edit.text():
+            self.matches = []
+            return
+        self._search()
+
     def _search(self):
+        self._search_timer.stop()  # Return pressed: don't re-run when the timer fires
         q = self.search_edit.text()
         self.matches = self.playlist_service.search(q)
         self.match_idx = 0
@@ -673,13 +673,13 @@ class ControlsView(QWidget):
         
     def _clean_chars(self):
         indices = self._get_selected_indices()
-        c = self.playlist_service.clean_special_chars_selected(indices)
-        if c: self._refresh()
+        changed = self.playlist_service.clean_special_chars_selected(indices)
+        if changed: self._refresh_rows(changed)
 
     def _filter_english(self):
         indices = self._get_selected_indices()
-        c = self.playlist_service.filter_non_english_in_selected(indices)
-        if c: self._refresh()
+        changed = self.playlist_service.filter_non_english_in_selected(indices)
+        if changed: self._refresh_rows(changed)
 
     def _regen_marked(self):
         """Generate all marked items. If Auto-loop is checked, each chunk retries harder in-place."""
@@ -757,7 +757,6 @@ class ControlsView(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            from utils.text_processor import TextPreprocessor
             processor = TextPreprocessor()
             
             # Access state through playlist_service
@@ -23,6 +23,7 @@ class FinalizeView(QWidget):
         # self.assembly_service.assembly_started.connect(self._on_assembly_started) # Handler doesn't exist/needed
         
     def setup_ui(self):
+        settings = self.state.settings  # Bound once; read for every widget below
         layout = QVBoxLayout(self)
         
         # Header
@@ -52,9 +53,9 @@ class FinalizeView(QWidget):
         
         # Normalization
         self.norm_chk = QCheckBox("Enable EBU R128 Normalization")
-        self.norm_chk.setChecked(self.state.settings.norm_enabled)
+        self.norm_chk.setChecked(settings.norm_enabled)
         self.norm_chk.stateChanged.connect(lambda state: setattr(self.state.settings, 'norm_enabled', state == Qt.Checked or state == 2))
-        self.norm_val = QDoubleSpinBox(); self.norm_val.setValue(self.state.settings.norm_level); self.norm_val.setRange(-50, 0)
+        self.norm_val = QDoubleSpinBox(); self.norm_val.setValue(settings.norm_level); self.norm_val.setRange(-50, 0)
         self.norm_val.valueChanged.connect(lambda v: setattr(self.state.settings, 'norm_level', v))
         
         norm_row = QHBoxLayout()
@@ -67,29 +68,16 @@ class FinalizeView(QWidget):
         # Silence Removal (Auto-Editor)
         self.silence_chk = QCheckBox("Enable Silence Removal")
         self.silence_chk.setToolTip("Requires auto-editor installed")
-        self.silence_chk.setChecked(self.state.settings.silence_removal_enabled)
+        self.silence_chk.setChecked(settings.silence_removal_enabled)
         self.silence_chk.stateChanged.connect(lambda state: setattr(self.state.settings, 'silence_removal_enabled', state == Qt.Checked or state == 2))
         proc_layout.addRow(self.silence_chk)
         
-        # Silence Params (Legacy restoration)
-        sil_params_layout = QHBoxLayout()
-        
-        self.thresh_spin = QDoubleSpinBox(); self.thresh_spin.setRange(0.01, 1.0); self.thresh_spin.setSingleStep(0.01); self.thresh_spin.setValue(self.state.settings.silence_threshold)
-        self.thresh_spin.valueChanged.connect(lambda v: setattr(self.state.settings, 'silence_threshold', v))
-        sil_params_layout.addWidget(QLabel("Thresh:"))
-        sil_params_layout.addWidget(self.thresh_spin)
-        
-        self.speed_spin = QDoubleSpinBox(); self.speed_spin.setRange(1.0, 99999.0); self.speed_spin.setValue(self.state.settings.silent_speed)
-        self.speed_spin.valueChanged.connect(lambda v: setattr(self.state.settings, 'silent_speed', v))
-        sil_params_layout.addWidget(QLabel("Speed:"))
-        sil_params_layout.addWidget(self.speed_spin)
-        
-        self.margin_spin = QSpinBox(); self.margin_spin.setRange(0, 100); self.margin_spin.setValue(self.state.settings.frame_margin)
-        self.margin_spin.valueChanged.connect(lambda v: setattr(self.state.settings, 'frame_margin', v))
-        sil_params_layout.addWidget(QLabel("Margin:"))
-        sil_params_layout.addWidget(self.margin_spin)
-        
-        proc_layout.addRow(sil_params_layout)
+        # Silence Params (Legacy restoration); built the first time silence removal is enabled
+        self._silence_params_built = False
+        self._sil_params_layout = QHBoxLayout()
+        proc_layout.addRow(self._sil_params_layout)
+        self.silence_chk.toggled.connect(self._on_silence_toggled)
+        self._on_silence_toggled(self.silence_chk.isChecked())
         
         # Formatting
         self.smart_chunk_chk = QCheckBox("Smart Chunking (Merge small files)")
@@ -99,11 +87,11 @@ class FinalizeView(QWidget):
         # Fine Tuning
 
         
-        self.max_chars = QSpinBox(); self.max_chars.setRange(100, 5000); self.max_chars.setValue(self.state.settings.max_chunk_chars)
+        self.max_chars = QSpinBox(); self.max_chars.setRange(100, 5000); self.max_chars.setValue(settings.max_chunk_chars)
         self.max_chars.valueChanged.connect(lambda v: setattr(self.state.settings, 'max_chunk_chars', v))
         proc_layout.addRow("Max Chars per Chunk:", self.max_chars)
         
-        self.sil_dur = QSpinBox(); self.sil_dur.setRange(0, 5000); self.sil_dur.setValue(self.state.settings.silence_duration)
+        self.sil_dur = QSpinBox(); self.sil_dur.setRange(0, 5000); self.sil_dur.setValue(settings.silence_duration)
         self.sil_dur.valueChanged.connect(lambda v: setattr(self.state.settings, 'silence_duration', v))
         proc_layout.addRow("Silence Duration (ms):", self.sil_dur)
         
@@ -128,6 +116,30 @@ class FinalizeView(QWidget):
         
         self.check_deps()
 
+    def _on_silence_toggled(self, checked: bool) -> None:
+        if checked and not self._silence_params_built:
+            self._build_silence_params()
+
+    def _build_silence_params(self) -> None:
+        """Adds the auto-editor threshold/speed/margin controls, reading the current settings."""
+        settings = self.state.settings  # Bound once; read for every widget below
+        self._silence_params_built = True
+        
+        self.thresh_spin = QDoubleSpinBox(); self.thresh_spin.setRange(0.01, 1.0); self.thresh_spin.setSingleStep(0.01); self.thresh_spin.setValue(settings.silence_threshold)
+        self.thresh_spin.valueChanged.connect(lambda v: setattr(self.state.settings, 'silence_threshold', v))
+        self._sil_params_layout.addWidget(QLabel("Thresh:"))
+        self._sil_params_layout.addWidget(self.thresh_spin)
+        
+        self.speed_spin = QDoubleSpinBox(); self.speed_spin.setRange(1.0, 99999.0); self.speed_spin.setValue(settings.silent_speed)
+        self.speed_spin.valueChanged.connect(lambda v: setattr(self.state.settings, 'silent_speed', v))
+        self._sil_params_layout.addWidget(QLabel("Speed:"))
+        self._sil_params_layout.addWidget(self.speed_spin)
+        
+        self.margin_spin = QSpinBox(); self.margin_spin.setRange(0, 100); self.margin_spin.setValue(settings.frame_margin)
+        self.margin_spin.valueChanged.connect(lambda v: setattr(self.state.settings, 'frame_margin', v))
+        self._sil_params_layout.addWidget(QLabel("Margin:"))
+        self._sil_params_layout.addWidget(self.margin_spin)
+
     def check_deps(self):
         ffmpeg_loc = shutil.which('ffmpeg')
         if not ffmpeg_loc:
@@ -196,8 +208,8 @@ class FinalizeView(QWidget):
         self.btn_assemble.setEnabled(False); self.btn_assemble.setText("Assembling...")
         self.btn_export.setEnabled(False)
         
-        # Call Service (Threaded)
-        self.assembly_service.assemble_audiobook(path, is_for_acx=False, metadata=metadata)
+        # Call Service (Threaded) - finished/error signals unlock the buttons
+        self.assembly_service.assemble_audiobook_async(path, is_for_acx=False, metadata=metadata)
         
     def export_chapters(self):
         if not hasattr(self, 'assembly_service'): return
@@ -214,7 +226,7 @@ class FinalizeView(QWidget):
         self.btn_assemble.setEnabled(False)
         self.btn_export.setEnabled(False); self.btn_export.setText("Exporting...")
 
-        self.assembly_service.export_by_chapter(path)
+        self.assembly_service.export_by_chapter_async(path)
 
     def auto_assemble(self):
         """"""
@@ -4,6 +4,7 @@ from PySide6.QtWidgets import (
     QLineEdit, QSpinBox, QPlainTextEdit, QScrollArea, QCheckBox
 )
 from PySide6.QtCore import Qt, QThread, Slot
+from functools import partial
 from typing import Optional, List, Dict, Any
 import uuid
 
@@ -15,6 +16,51 @@ from core.services.template_service import TemplateService
 from engines import list_engines
 from PySide6.QtWidgets import QInputDialog, QFileDialog
 
+# Slider tables: (attribute, GenerationSettings field, label, min, max, step,
+# left hint, right hint, tooltip, moves the preset combo to "Custom")
+VOICE_SLIDER_SPECS = (
+    ('exag_slider', 'exaggeration', "Exaggeration:", 0.0, 1.0, 0.1, "Monotone", "Expressive",
+     "Emotional intensity. 0.0 = flat/monotone, 0.5 = neutral, 1.0 = very expressive", True),
+    ('speed_slider', 'speed', "Speed:", 0.5, 2.0, 0.1, "0.5x Slower", "2x Faster",
+     "Speaking rate. 0.5 = half speed, 1.0 = normal, 2.0 = double speed.", False),
+    ('temp_slider', 'temperature', "Temperature:", 0.1, 2.5, 0.1, "Consistent", "Varied",
+     "Creativity/randomness. Lower = consistent/robotic, Higher = varied/natural.", True),
+    ('cfg_slider', 'cfg_weight', "CFG Scale:", 0.1, 1.0, 0.1, "Creative", "Exact Match",
+     "How closely to match the reference voice. Higher = stronger accent/tone.", False),
+)
+
+FX_SLIDER_SPECS = (
+    ('pitch_slider', 'pitch_shift', "Pitch Shift:", -12.0, 12.0, 0.5, "Deeper (-12)", "Higher (+12)",
+     "Shift voice pitch in semitones. Negative = deeper voice, Positive = higher voice.", False),
+    ('timbre_slider', 'timbre_shift', "Timbre Shift:", -3.0, 3.0, 0.1, "Warmer/Darker", "Brighter/Thinner",
+     "Adjust vocal character (formants). Negative = warmer/darker (boosts lows), Positive = brighter (boosts highs).", False),
+    ('gruffness_slider', 'gruffness', "Gruffness:", 0.0, 1.0, 0.05, "Clean", "Gravelly", None, False),
+    ('bass_slider', 'bass_boost', "Bass Boost:", -12.0, 12.0, 0.5, "Cut", "Boost",
+     "EQ: Adjust low frequencies (100Hz Shelf).", False),
+    ('treble_slider', 'treble_boost', "Treble Boost:", -12.0, 12.0, 0.5, "Cut", "Boost",
+     "EQ: Adjust high frequencies (8kHz Shelf).", False),
+)
+
+# Drag granularity per field. 0.02 is finer than anyone can hear and gives
+# 45-75 positions instead of 90-150, so a drag emits half the value changes.
+SLIDER_TICKS = {
+    'exaggeration': 0.02,
+    'speed': 0.02,
+    'cfg_weight': 0.02,
+}
+
+# (slider attribute, GenerationSettings field) pairs synced by refresh_values()
+SLIDER_SETTINGS = tuple((spec[0], spec[1]) for spec in VOICE_SLIDER_SPECS + FX_SLIDER_SPECS)
+
+# GenerationSettings fields stored in a voice template. Voice design only:
+# session config (GPU, retries, ASR thresholds) is deliberately left out.
+VOICE_TEMPLATE_KEYS = (
+    'exaggeration', 'speed', 'temperature', 'pitch_shift',
+    'timbre_shift', 'gruffness', 'bass_boost', 'treble_boost',
+    'cfg_weight', 'tts_engine', 'auto_expression_enabled',
+    'expression_sensitivity',
+)
+
 # Worker thread wrapper for GenerationService
 class GenerationWorker(QThread):
     def __init__(self, service: GenerationService) -> None:
@@ -242,103 +288,38 @@ class GenerationView(QWidget):
         # --- Voice Parameters ---
         
         # --- Sliders ---
-        self.exag_slider = QLabeledSlider(
-            "Exaggeration:", 0.0, 1.0, self.state.settings.exaggeration,
-            left_label="Monotone", right_label="Expressive"
-        )
-        self.exag_slider.setToolTip("Emotional intensity. 0.0 = flat/monotone, 0.5 = neutral, 1.0 = very expressive")
-        self.exag_slider.value_changed.connect(self._on_exag_changed)
-        v_layout.addWidget(self.exag_slider)
-        
-        self.speed_slider = QLabeledSlider(
-            "Speed:", 0.5, 2.0, self.state.settings.speed,
-            left_label="0.5x Slower", right_label="2x Faster"
-        )
-        self.speed_slider.setToolTip("Speaking rate. 0.5 = half speed, 1.0 = normal, 2.0 = double speed.")
-        self.speed_slider.value_changed.connect(
-            lambda v: setattr(self.state.settings, 'speed', v)
-        )
-        v_layout.addWidget(self.speed_slider)
-        
-        self.temp_slider = QLabeledSlider(
-            "Temperature:", 0.1, 2.5, self.state.settings.temperature,
-            left_label="Consistent", right_label="Varied"
-        )
-        self.temp_slider.setToolTip("Creativity/randomness. Lower = consistent/robotic, Higher = varied/natural.")
-        self.temp_slider.value_changed.connect(self._on_temp_changed)
-        v_layout.addWidget(self.temp_slider)
-
-        self.cfg_slider = QLabeledSlider(
-            "CFG Scale:", 0.1, 1.0, self.state.settings.cfg_weight,
-            left_label="Creative", right_label="Exact Match"
-        )
-        self.cfg_slider.setToolTip("How closely to match the reference voice. Higher = stronger accent/tone.")
-        self.cfg_slider.value_changed.connect(
-            lambda v: setattr(self.state.settings, 'cfg_weight', v)
-        )
-        v_layout.addWidget(self.cfg_slider)
+        self._add_sliders(v_layout, VOICE_SLIDER_SPECS)
         
         voice_collapsible.add_layout(v_layout)
         layout.addWidget(voice_collapsible)
         
-        fx_collapsible = CollapsibleFrame("Voice Effects (Post-Process)", start_open=False)
+        # Starts closed, so the effect sliders are only built the first time it's opened
+        fx_collapsible = CollapsibleFrame("Voice Effects (Post-Process)", start_open=False,
+                                          builder=self._setup_fx_sliders)
+        layout.addWidget(fx_collapsible)
+
+    def _setup_fx_sliders(self, group: CollapsibleFrame) -> None:
         f_layout = QVBoxLayout()
         f_layout.setSpacing(5)
         f_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.pitch_slider = QLabeledSlider(
-            "Pitch Shift:", -12.0, 12.0, self.state.settings.pitch_shift, step=0.5,
-            left_label="Deeper (-12)", right_label="Higher (+12)"
-        )
-        self.pitch_slider.setToolTip("Shift voice pitch in semitones. Negative = deeper voice, Positive = higher voice.")
-        self.pitch_slider.value_changed.connect(
-            lambda v: setattr(self.state.settings, 'pitch_shift', v)
-        )
-        f_layout.addWidget(self.pitch_slider)
+        self._add_sliders(f_layout, FX_SLIDER_SPECS)
         
-        self.timbre_slider = QLabeledSlider(
-            "Timbre Shift:", -3.0, 3.0, self.state.settings.timbre_shift, step=0.1,
-            left_label="Warmer/Darker", right_label="Brighter/Thinner"
-        )
-        self.timbre_slider.setToolTip("Adjust vocal character (formants). Negative = warmer/darker (boosts lows), Positive = brighter (boosts highs).")
-        self.timbre_slider.value_changed.connect(
-            lambda v: setattr(self.state.settings, 'timbre_shift', v)
-        )
-        f_layout.addWidget(self.timbre_slider)
-
-        self.gruffness_slider = QLabeledSlider(
-            "Gruffness:", 0.0, 1.0, self.state.settings.gruffness, step=0.05,
-            left_label="Clean", right_label="Gravelly"
-        )
-        self.gruffness_slider.value_changed.connect(
-            lambda v: setattr(self.state.settings, 'gruffness', v)
-        )
-        f_layout.addWidget(self.gruffness_slider)
+        group.add_layout(f_layout)
         
-        # New: Bass / Treble
-        self.bass_slider = QLabeledSlider(
-            "Bass Boost:", -12.0, 12.0, self.state.settings.bass_boost, step=0.5,
-            left_label="Cut", right_label="Boost"
-        )
-        self.bass_slider.setToolTip("EQ: Adjust low frequencies (100Hz Shelf).")
-        self.bass_slider.value_changed.connect(
-            lambda v: setattr(self.state.settings, 'bass_boost', v)
-        )
-        f_layout.addWidget(self.bass_slider)
+    def _add_sliders(self, layout: QVBoxLayout, specs) -> None:
+        """Builds one QLabeledSlider per spec row, bound to its GenerationSettings field."""
+        settings = self.state.settings
+        for attr, field, label, lo, hi, step, left, right, tooltip, affects_preset in specs:
+            slider = QLabeledSlider(label, lo, hi, getattr(settings, field), step=step,
+                                    left_label=left, right_label=right,
+                                    tick=SLIDER_TICKS.get(field))
+            if tooltip:
+                slider.setToolTip(tooltip)
+            slider.value_changed.connect(partial(self._on_slider_changed, field, affects_preset))
+            setattr(self, attr, slider)
+            layout.addWidget(slider)
 
-        self.treble_slider = QLabeledSlider(
-            "Treble Boost:", -12.0, 12.0, self.state.settings.treble_boost, step=0.5,
-            left_label="Cut", right_label="Boost"
-        )
-        self.treble_slider.setToolTip("EQ: Adjust high frequencies (8kHz Shelf).")
-        self.treble_slider.value_changed.connect(
-            lambda v: setattr(self.state.settings, 'treble_boost', v)
-        )
-        f_layout.addWidget(self.treble_slider)
-        
-        fx_collapsible.add_layout(f_layout)
-        layout.addWidget(fx_collapsible)
-        
     def setup_voice_save(self, layout: QVBoxLayout) -> None:
         # --- Voice Save Section (Moved from Sliders) ---
         save_group = QGroupBox("Voice Save")
@@ -475,15 +456,11 @@ class GenerationView(QWidget):
             self.preset_desc_label.setText("")
             self.preset_combo.blockSignals(False)
     
-    def _on_exag_changed(self, value: float) -> None:
-        """Handles exaggeration slider changes."""
-        setattr(self.state.settings, 'exaggeration', value)
-        self._on_manual_slider_change()
-    
-    def _on_temp_changed(self, value: float) -> None:
-        """Handles temperature slider changes."""
-        setattr(self.state.settings, 'temperature', value)
-        self._on_manual_slider_change()
+    def _on_slider_changed(self, field: str, affects_preset: bool, value: float) -> None:
+        """Writes a slider value to its settings field; preset sliders also switch to "Custom"."""
+        setattr(self.state.settings, field, value)
+        if affects_preset:
+            self._on_manual_slider_change()
 
     def load_voice_from_combo(self) -> None:
         name = self.voice_load_combo.currentText()
@@ -531,20 +508,9 @@ class GenerationView(QWidget):
                                   QMessageBox.Yes | QMessageBox.No) != QMessageBox.Yes:
                 return
 
-        import dataclasses
-        all_settings = dataclasses.asdict(self.state.settings)
-        
-        # Voice Template should ONLY contain Voice Design params.
-        # It should NOT contain Session Config (GPU, Retries, ASR thresholds).
-        voice_keys = [
-            'exaggeration', 'speed', 'temperature', 'pitch_shift',
-            'timbre_shift', 'gruffness', 'bass_boost', 'treble_boost',
-            'cfg_weight', 'tts_engine', 'auto_expression_enabled',
-            'expression_sensitivity'
-            # They are infrastructure config, not voice design parameters.
-        ]
-        
-        data = {k: all_settings[k] for k in voice_keys if k in all_settings}
+        # Read just the voice fields; asdict() would deep-copy every setting first
+        settings = self.state.settings
+        data = {k: getattr(settings, k) for k in VOICE_TEMPLATE_KEYS if hasattr(settings, k)}
         
         # Inject ref audio (Crucial for voice identity)
         data['ref_audio_path'] = self.state.ref_audio_path
@@ -627,35 +593,14 @@ class GenerationView(QWidget):
         self.ref_audio_edit.setText(self.state.ref_audio_path or "")
         self.ref_audio_edit.blockSignals(False)
         
-        if hasattr(self, 'exag_slider'): self.exag_slider.blockSignals(True)
-        if hasattr(self, 'speed_slider'): self.speed_slider.blockSignals(True)
-        if hasattr(self, 'temp_slider'): self.temp_slider.blockSignals(True)
-        if hasattr(self, 'cfg_slider'): self.cfg_slider.blockSignals(True)
-        if hasattr(self, 'pitch_slider'): self.pitch_slider.blockSignals(True)
-        if hasattr(self, 'timbre_slider'): self.timbre_slider.blockSignals(True)
-        if hasattr(self, 'gruffness_slider'): self.gruffness_slider.blockSignals(True)
-        if hasattr(self, 'bass_slider'): self.bass_slider.blockSignals(True)
-        if hasattr(self, 'treble_slider'): self.treble_slider.blockSignals(True)
-
-        if hasattr(self, 'exag_slider'): self.exag_slider.set_value(s.exaggeration)
-        if hasattr(self, 'speed_slider'): self.speed_slider.set_value(s.speed)
-        if hasattr(self, 'temp_slider'): self.temp_slider.set_value(s.temperature)
-        if hasattr(self, 'cfg_slider'): self.cfg_slider.set_value(s.cfg_weight)
-        if hasattr(self, 'pitch_slider'): self.pitch_slider.set_value(s.pitch_shift)
-        if hasattr(self, 'timbre_slider'): self.timbre_slider.set_value(s.timbre_shift)
-        if hasattr(self, 'gruffness_slider'): self.gruffness_slider.set_value(s.gruffness)
-        if hasattr(self, 'bass_slider'): self.bass_slider.set_value(s.bass_boost)
-        if hasattr(self, 'treble_slider'): self.treble_slider.set_value(s.treble_boost)
-        
-        if hasattr(self, 'exag_slider'): self.exag_slider.blockSignals(False)
-        if hasattr(self, 'speed_slider'): self.speed_slider.blockSignals(False)
-        if hasattr(self, 'temp_slider'): self.temp_slider.blockSignals(False)
-        if hasattr(self, 'cfg_slider'): self.cfg_slider.blockSignals(False)
-        if hasattr(self, 'pitch_slider'): self.pitch_slider.blockSignals(False)
-        if hasattr(self, 'timbre_slider'): self.timbre_slider.blockSignals(False)
-        if hasattr(self, 'gruffness_slider'): self.gruffness_slider.blockSignals(False)
-        if hasattr(self, 'bass_slider'): self.bass_slider.blockSignals(False)
-        if hasattr(self, 'treble_slider'): self.treble_slider.blockSignals(False)
+        # One attribute lookup per slider instead of three hasattr + three getattr passes
+        for attr, field in SLIDER_SETTINGS:
+            slider = getattr(self, attr, None)
+            if slider is None:
+                continue
+            slider.blockSignals(True)
+            slider.set_value(getattr(s, field))
+            slider.blockSignals(False)
 
         # Restore the specific preset text silently
         if hasattr(s, 'voice_preset') and hasattr(self, 'preset_combo'):
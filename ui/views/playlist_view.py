@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListView, 
                                QLabel, QStyle, QStyledItemDelegate, QGroupBox, QFormLayout)
 from PySide6.QtGui import QColor, QBrush, QPalette
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QItemSelectionModel
 from core.state import AppState
 from core.models.playlist_model import PlaylistModel
 
@@ -11,6 +11,11 @@ class PlaylistDelegate(QStyledItemDelegate):
     
     letting super().paint() handle text rendering for CSS compatibility.
     """
+    # Built once; initStyleOption runs for every row on every repaint
+    _CHAPTER_BRUSH = QBrush(QColor("#1A2E4A"))  # Deep blue — committed chapter
+    _FAILED_BRUSH = QBrush(QColor("#543030"))   # Darker red
+    _SUCCESS_BRUSH = QBrush(QColor("#2E4B2E"))  # Darker green
+
     def initStyleOption(self, option, index):
         super().initStyleOption(option, index)
 
@@ -18,7 +23,6 @@ class PlaylistDelegate(QStyledItemDelegate):
         status = index.data(PlaylistModel.StatusRole)
 
         # Check is_chapter_heading directly from model data
-        from PySide6.QtCore import Qt as _Qt
         sentences = index.model().app_state.sentences
         row = index.row()
         is_chapter = (
@@ -29,11 +33,11 @@ class PlaylistDelegate(QStyledItemDelegate):
         # Apply background colours (priority: chapter > error/success)
         if not (option.state & QStyle.State_Selected):
             if is_chapter:
-                option.backgroundBrush = QBrush(QColor("#1A2E4A"))  # Deep blue — committed chapter
+                option.backgroundBrush = self._CHAPTER_BRUSH
             elif status == "failed":
-                option.backgroundBrush = QBrush(QColor("#543030"))  # Darker red
+                option.backgroundBrush = self._FAILED_BRUSH
             elif status == "success":
-                option.backgroundBrush = QBrush(QColor("#2E4B2E"))  # Darker green
+                option.backgroundBrush = self._SUCCESS_BRUSH
 
 
 class PlaylistView(QWidget):
@@ -65,6 +69,10 @@ class PlaylistView(QWidget):
         self.list_view.setItemDelegate(PlaylistDelegate()) 
         self.list_view.setSelectionMode(QListView.ExtendedSelection)
         self.list_view.setAlternatingRowColors(True)
+        # Lay out long books in slices between events instead of one blocking pass per reset.
+        # (Not uniform sizes: status emoji can fall back to a taller font on some rows.)
+        self.list_view.setLayoutMode(QListView.Batched)
+        self.list_view.setBatchSize(500)
         
         # Connect selection and data changes to stats update
         self.list_view.selectionModel().selectionChanged.connect(self.update_stats)
@@ -104,6 +112,11 @@ class PlaylistView(QWidget):
         
     def refresh(self):
         self.model.refresh()
+
+    def update_items(self, indices: list[int]) -> None:
+        """Repaints just these rows (one dataChanged) after in-place status edits."""
+        self.model.update_rows(indices)
+        self.update_stats()
         
     def on_data_changed(self, top_left, bottom_right, roles=None):
         """Called when model data changes. Updates stats if selected item changed."""
@@ -155,11 +168,10 @@ class PlaylistView(QWidget):
         """"""
         idx = self.model.index(row_index, 0)
         if idx.isValid():
-            self.list_view.clearSelection()
-            self.list_view.setCurrentIndex(idx)
+            # One selection change: Qt repaints just the old and new rows, and
+            # selectionChanged runs update_stats once (not at all if nothing changed)
+            self.list_view.selectionModel().setCurrentIndex(idx, QItemSelectionModel.ClearAndSelect)
             self.list_view.scrollTo(idx, QListView.PositionAtCenter)
-            # Ensure stats update
-            self.update_stats()
 
     def update_theme(self, theme_name: str) -> None:
         """
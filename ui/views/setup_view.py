@@ -7,7 +7,6 @@ from PySide6.QtCore import Qt, Signal
 from typing import Optional, List, Dict, Any
 import os
 import shutil
-import dataclasses
 import logging
 
 from core.state import AppState
@@ -138,55 +137,38 @@ class SetupView(QWidget):
     def setup_key_params(self, layout: QVBoxLayout) -> None:
         """Restores the 'Key Parameters (Loaded)' display from Reference."""
         group = QGroupBox("Key Parameters (Summary)")
-        f_layout = QFormLayout(group)
-        
-        self.lbl_ref_audio = QLabel("--")
-        self.lbl_voice_name = QLabel("--") # New
-        self.lbl_voice_preset = QLabel("--")
-        self.lbl_exaggeration = QLabel("--")
-        self.lbl_temp = QLabel("--")
-        self.lbl_speed = QLabel("--")
-        self.lbl_auto_expression = QLabel("--")
-        
-        f_layout.addRow("Voice Profile:", self.lbl_voice_name) # New
-        f_layout.addRow("Voice Preset:", self.lbl_voice_preset)
-        f_layout.addRow("Reference Audio:", self.lbl_ref_audio)
-        f_layout.addRow("Exaggeration:", self.lbl_exaggeration)
-        f_layout.addRow("Temperature:", self.lbl_temp)
-        f_layout.addRow("Speed:", self.lbl_speed)
-        f_layout.addRow("Auto-Expression:", self.lbl_auto_expression)
+        g_layout = QVBoxLayout(group)
+        
+        # Display-only: one multi-line label instead of a caption/value label pair per row
+        self.lbl_params = QLabel("--")
+        self.lbl_params.setTextFormat(Qt.PlainText)
+        g_layout.addWidget(self.lbl_params)
         
         # Edit Button to jump to Generation Tab? (Optional, kept simpler for now)
         layout.addWidget(group)
         
     def refresh_params_display(self) -> None:
-        """Updates the Parameter labels from AppState."""
-        self.lbl_voice_name.setText(self.state.voice_name) # New
-
-        # Ref Audio
-        ref = self.state.ref_audio_path
-        self.lbl_ref_audio.setText(os.path.basename(ref) if ref else "None")
-        if ref: self.lbl_ref_audio.setToolTip(ref)
-            
-        # Settings
+        """Updates the Parameter summary from AppState."""
         s = self.state.settings
-        self.lbl_exaggeration.setText(f"{s.exaggeration:.2f}")
-        self.lbl_temp.setText(f"{s.temperature:.2f}")
-        self.lbl_speed.setText(f"{s.speed:.2f}x")
-        
-        # Voice Preset (from generation view if available)
-        preset = getattr(s, 'voice_preset', 'Custom')
-        self.lbl_voice_preset.setText(preset)
+        ref = self.state.ref_audio_path
         
         # Auto-Expression
-        auto_expr = getattr(s, 'auto_expression_enabled', False)
-        sensitivity = getattr(s, 'expression_sensitivity', 1.0)
-        if auto_expr:
-            self.lbl_auto_expression.setText(f"Enabled (Sensitivity: {sensitivity:.1f})")
+        if getattr(s, 'auto_expression_enabled', False):
+            sensitivity = getattr(s, 'expression_sensitivity', 1.0)
+            auto_expr = f"Enabled (Sensitivity: {sensitivity:.1f})"
         else:
-            self.lbl_auto_expression.setText("Disabled")
-            
-        pass
+            auto_expr = "Disabled"
+        
+        self.lbl_params.setText("\n".join((
+            f"Voice Profile: {self.state.voice_name}",
+            f"Voice Preset: {getattr(s, 'voice_preset', 'Custom')}",
+            f"Reference Audio: {os.path.basename(ref) if ref else 'None'}",
+            f"Exaggeration: {s.exaggeration:.2f}",
+            f"Temperature: {s.temperature:.2f}",
+            f"Speed: {s.speed:.2f}x",
+            f"Auto-Expression: {auto_expr}",
+        )))
+        if ref: self.lbl_params.setToolTip(ref)
 
     # UI refreshes should be signal-driven, not event-driven
     
@@ -398,11 +380,9 @@ class SetupView(QWidget):
             
             # 2. Internal Editor (ReviewTextDialog)
             from ui.dialogs.review_text_dialog import ReviewTextDialog
-            dlg = ReviewTextDialog(raw_text, self)
+            final_text = ReviewTextDialog.show_for(raw_text, self)
             
-            if dlg.exec():
-                final_text = dlg.result_text
-                
+            if final_text is not None:
                 # 3. Save changes to source file
                 try:
                     with open(self.state.source_file_path, 'w', encoding='utf-8') as f:
@@ -439,14 +419,8 @@ class SetupView(QWidget):
         
         QMessageBox.information(self, "Success", f"Loaded {len(sentences)} chunks.")
         
-        # Save Session
-        self.project_service.save_session(self.state.session_name, {
-            "source_file_path": self.state.source_file_path,
-            "sentences": self.state.sentences,
-            "generation_settings": dataclasses.asdict(self.state.settings),
-            "ref_audio_path": self.state.ref_audio_path,
-            "voice_preset": getattr(self.state.settings, 'voice_preset', 'Custom')
-        })
+        # Save Session (same schema as every other save path)
+        self.project_service.save_current_session(self.state)
 
     def new_session(self) -> None:
         self.session_name_edit.clear()
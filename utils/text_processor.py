@@ -24,12 +24,30 @@ try:
     from bs4 import BeautifulSoup
 except ImportError:
     BeautifulSoup = None
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+    etree = None
 try:
     import pypandoc
 except ImportError:
     pypandoc = None
 
 
+def _html_text_parts(html: bytes) -> list:
+    """
+    Returns the stripped, non-empty text nodes of an HTML document (scripts,
+    styles and comments dropped), matching BeautifulSoup's get_text(strip=True).
+    """
+    if not html or not html.strip():
+        return []
+    root = lxml.html.fromstring(html)
+    etree.strip_elements(root, 'script', 'style', etree.Comment, with_tail=False)
+    return [t for t in (s.strip() for s in root.itertext()) if t]
+
+
 def punc_norm(text: str) -> str:
     """Quick cleanup func for punctuation from LLMs or containing chars not seen often in the dataset."""
     if not text:
@@ -126,6 +144,17 @@ def punc_norm(text: str) -> str:
     return text
 
 
+def fold_for_comparison(text: str) -> str:
+    """
+    NFKC-normalize and casefold text for similarity comparisons.
+    Text ingested through TextPreprocessor is already NFKC, so the table walk
+    is skipped for it and only raw ASR output pays for normalization.
+    """
+    if not unicodedata.is_normalized('NFKC', text):
+        text = unicodedata.normalize('NFKC', text)
+    return text.casefold()
+
+
 class TextPreprocessor:
     """Handles all text extraction and splitting logic."""
     def __init__(self):
@@ -139,6 +168,9 @@ class TextPreprocessor:
 
         # Regex for aggressive character cleaning. Whitelists common characters.
         self.aggressive_clean_re = re.compile(r"[^a-zA-Z0-9\s'\",.?!-]")
+        # filter_non_english_words: the part of a word between its leading/trailing non-letters
+        self._word_core_re = re.compile(r"[^a-zA-Z]*(.*?)[^a-zA-Z]*", re.DOTALL)
+        self._valid_word_re = re.compile(r"[a-zA-Z]+(?:['-]?[a-zA-Z]+)*")
 
         # Define patterns for spelled-out numbers from one to ninety-nine
         units = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
@@ -153,6 +185,8 @@ class TextPreprocessor:
             rf'^\s*(chapter\s+([ivxlcdm]+|\d+|{number_words_pattern})|prologue|epilogue)',
             re.IGNORECASE
         )
+        # A stripped heading can only start with the first letter of chapter/prologue/epilogue
+        self._chapter_first_chars = frozenset('cCpPeE')
         
         # --- Pronunciation Dictionary (Optional Enhancement) ---
         # Initialize pronunciation dictionary
@@ -162,12 +196,18 @@ class TextPreprocessor:
         except Exception:
             self.pronunciation_dict = None
 
+    def is_chapter_heading(self, stripped: str) -> bool:
+        """chapter_regex.match() for already-stripped text, skipping the regex on most sentences."""
+        return stripped[:1] in self._chapter_first_chars and bool(self.chapter_regex.match(stripped))
+
     def remove_accents(self, text: str) -> str:
         """
         Convert accented characters to their ASCII equivalents.
         Examples: ñ → n, á → a, é → e, ü → u
         This preserves pronunciation while making text TTS-safe.
         """
+        if text.isascii():
+            return text  # Nothing to decompose
         # Normalize to NFD (decomposed form) where accents are separate characters
         nfd_form = unicodedata.normalize('NFD', text)
         # Filter out combining characters (accents)
@@ -178,7 +218,9 @@ class TextPreprocessor:
         """Removes characters not in a basic whitelist."""
         # First, convert accented characters to ASCII equivalents
         text = self.remove_accents(text)
-        # Then apply aggressive cleaning
+        # Then apply aggressive cleaning (most chunks are already clean: skip the copy)
+        if not self.aggressive_clean_re.search(text):
+            return text
         return self.aggressive_clean_re.sub('', text)
 
     def filter_non_english_words(self, text: str) -> str:
@@ -189,29 +231,19 @@ class TextPreprocessor:
         """
         words = text.split(' ')
         # A word is kept if it's purely alphabetic, or contains apostrophes/hyphens surrounded by letters.
-        valid_word_re = re.compile(r"^[a-zA-Z]+(?:['-]?[a-zA-Z]+)*$")
+        word_core = self._word_core_re.fullmatch
+        is_valid = self._valid_word_re.fullmatch
         
         filtered_words = []
         for word in words:
-            # Preserve punctuation by stripping it before checking, then re-adding it.
-            leading_punc = ''
-            trailing_punc = ''
-            
-            # Find leading non-alphanumeric characters
-            match_lead = re.match(r'^[^a-zA-Z]*', word)
-            if match_lead:
-                leading_punc = match_lead.group(0)
-            
-            # Find trailing non-alphanumeric characters
-            match_trail = re.search(r'[^a-zA-Z]*$', word)
-            if match_trail:
-                trailing_punc = match_trail.group(0)
-                
-            clean_word = word[len(leading_punc):len(word)-len(trailing_punc)]
+            # Preserve punctuation by checking only the core between leading/trailing non-letters
+            clean_word = word_core(word).group(1)
 
-            if valid_word_re.match(clean_word) or clean_word == '':
+            if not clean_word or is_valid(clean_word):
                 filtered_words.append(word)
         
+        if len(filtered_words) == len(words):
+            return text  # Nothing dropped
         return ' '.join(filtered_words)
 
     def smart_split_long_sentence(self, sentence: str, max_chars: int = 400) -> list:
@@ -353,7 +385,14 @@ class TextPreprocessor:
                     return f"Error: pdftextract not installed. Cannot read {ext}."
             
             elif ext == '.epub':
-                if ebooklib and BeautifulSoup:
+                if ebooklib and lxml:
+                    # C parser, one document at a time: no giant concatenated HTML buffer
+                    book = epub.read_epub(path)
+                    parts = []
+                    for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
+                        parts.extend(_html_text_parts(item.get_body_content()))
+                    text = "\n\n".join(parts)
+                elif ebooklib and BeautifulSoup:
                     book = epub.read_epub(path)
                     html_content = "".join([item.get_body_content().decode('utf-8', 'ignore') 
                                           for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT)])
@@ -387,6 +426,10 @@ class TextPreprocessor:
                 import logging
                 logging.info(f"Applied pronunciations: {', '.join(replacements)}")
         
+        # Fold fullwidth forms, ligatures and other compatibility characters once
+        # at ingest so every later comparison works on already-normalized text.
+        text = unicodedata.normalize('NFKC', text)
+
         if aggressive_clean:
             text = self.clean_text_aggressively(text)
         
@@ -417,7 +460,7 @@ class TextPreprocessor:
                 char_offset += len(sentence_text)
                 continue
 
-            is_chapter_heading = bool(self.chapter_regex.match(clean_sentence))
+            is_chapter_heading = self.is_chapter_heading(clean_sentence)
 
             # Split at natural pause points to improve TTS/ASR accuracy
             if len(clean_sentence) > 400 and not is_chapter_heading:
@@ -499,30 +542,90 @@ class TextPreprocessor:
             # Return original on error
             return current_sentences
 
-def _parse_compound_number(text, ones, teens, tens):
-    """Helper to parse complex compound numbers like 'two thousand twenty-four'."""
-    total = 0
-    current = 0
-    
-    words = text.lower().replace('-', ' ').split()
-    
-    for word in words:
-        if word == 'and':
+# --- Number Word Parsing ---
+# Plain dict lookups per token; the parser walks the text once instead of
+# running a cascade of regex passes over it.
+UNITS = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4,
+    'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9,
+    'ten': 10, 'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14,
+    'fifteen': 15, 'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19
+}
+TENS = {
+    'twenty': 20, 'thirty': 30, 'forty': 40, 'fifty': 50,
+    'sixty': 60, 'seventy': 70, 'eighty': 80, 'ninety': 90
+}
+SCALES = {'hundred': 100, 'thousand': 1000, 'million': 10**6}
+
+_WORD_SPLIT_RE = re.compile(r'(\w+)')
+_NUMBER_GAP_RE = re.compile(r'[-\s]+')
+
+def _fits(word, current, total):
+    """Can `word` extend the number accumulated so far (`total` + `current`)?"""
+    low = current % 100
+    if word in UNITS:
+        value = UNITS[word]
+        if value == 0:
+            return False  # "zero" is always its own number
+        if value < 10:
+            return low == 0 or (low >= 20 and low % 10 == 0)
+        return low == 0  # teens
+    if word in TENS:
+        return low == 0
+    if word == 'hundred':
+        return 0 < current < 100
+    if word in SCALES:
+        # Scales only step downwards: "two million five thousand", not "five thousand two thousand"
+        return current > 0 and total % (SCALES[word] * 1000) == 0
+    return False
+
+def _words_to_digits(text):
+    """Replace runs of spelled-out number words with their digit form.
+
+    "two thousand twenty-four" -> "2024", "one hundred and six" -> "106".
+    Adjacent numbers that can't combine stay separate ("one two" -> "1 2").
+    """
+    parts = _WORD_SPLIT_RE.split(text)
+    # parts alternates separator / word / separator ... (words at odd indices)
+    out = [parts[0]]
+    i, n = 1, len(parts)
+    while i < n:
+        word = parts[i]
+        if word not in UNITS and word not in TENS:
+            out.append(word)
+            out.append(parts[i + 1])
+            i += 2
             continue
-        elif word in ones:
-            current += ones[word]
-        elif word in teens:
-            current += teens[word]
-        elif word in tens:
-            current += tens[word]
-        elif word == 'hundred':
-            current *= 100
-        elif word == 'thousand':
-            current *= 1000
-            total += current
-            current = 0
-    
-    return total + current
+
+        total = 0
+        current = UNITS.get(word, TENS.get(word))
+        j = i  # index of the last word consumed into this number
+        if current != 0:
+            while j + 2 < n and _NUMBER_GAP_RE.fullmatch(parts[j + 1]):
+                nxt = parts[j + 2]
+                # "hundred and six" / "thousand and one"
+                if (nxt == 'and' and parts[j] in SCALES and j + 4 < n
+                        and _NUMBER_GAP_RE.fullmatch(parts[j + 3])
+                        and (parts[j + 4] in UNITS or parts[j + 4] in TENS)
+                        and _fits(parts[j + 4], current, total)):
+                    j += 2
+                    nxt = parts[j + 2]
+                elif not _fits(nxt, current, total):
+                    break
+
+                if nxt == 'hundred':
+                    current *= 100
+                elif nxt in SCALES:
+                    total += current * SCALES[nxt]
+                    current = 0
+                else:
+                    current += UNITS.get(nxt, TENS.get(nxt))
+                j += 2
+
+        out.append(str(total + current))
+        out.append(parts[j + 1])
+        i = j + 2
+    return ''.join(out)
 
 def normalize_numbers(text):
     """Convert written number words to digits for consistent ASR comparison.
@@ -531,76 +634,4 @@ def normalize_numbers(text):
     even when the TTS model correctly says the word. This function normalizes
     both texts to use digits before comparison.
     """
-    text_lower = text.lower()
-    
-    # Single number words (for direct replacement and compound building)
-    ones = {
-        'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4,
-        'five': 5, 'six': 6, 'seven': 7, 'eight': 8, 'nine': 9
-    }
-    teens = {
-        'ten': 10, 'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14,
-        'fifteen': 15, 'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19
-    }
-    tens = {
-        'twenty': 20, 'thirty': 30, 'forty': 40, 'fifty': 50,
-        'sixty': 60, 'seventy': 70, 'eighty': 80, 'ninety': 90
-    }
-    
-    # Pattern for compound numbers - process from most specific to least specific
-    
-    # Pattern: "X thousand Y hundred Z" (e.g., "two thousand three hundred forty-two")
-    text_lower = re.sub(
-        r'\b(one|two|three|four|five|six|seven|eight|nine)\s+thousand\s+(one|two|three|four|five|six|seven|eight|nine)\s+hundred\s+(?:and\s+)?(\w+(?:\s+|-)\w+|\w+)',
-        lambda m: str(_parse_compound_number(m.group(0), ones, teens, tens)),
-        text_lower
-    )
-    
-    # Pattern: "X thousand Y hundred" (e.g., "five thousand three hundred")
-    text_lower = re.sub(
-        r'\b(one|two|three|four|five|six|seven|eight|nine)\s+thousand\s+(one|two|three|four|five|six|seven|eight|nine)\s+hundred\b',
-        lambda m: str(_parse_compound_number(m.group(0), ones, teens, tens)),
-        text_lower
-    )
-    
-    # Pattern: "X thousand Y" where Y is a compound/teen/ten (e.g., "two thousand twenty-four")
-    text_lower = re.sub(
-        r'\b(one|two|three|four|five|six|seven|eight|nine)\s+thousand\s+(\w+(?:\s+|-)\w+|\w+)',
-        lambda m: str(_parse_compound_number(m.group(0), ones, teens, tens)),
-        text_lower
-    )
-    
-    # Pattern: "X thousand" alone (e.g., "two thousand")
-    text_lower = re.sub(
-        r'\b(one|two|three|four|five|six|seven|eight|nine)\s+thousand\b',
-        lambda m: str(ones.get(m.group(1), 0) * 1000),
-        text_lower
-    )
-    
-    # Pattern: "X hundred Y" (e.g., "one hundred fifty-six")
-    text_lower = re.sub(
-        r'\b(one|two|three|four|five|six|seven|eight|nine)\s+hundred\s+(?:and\s+)?(\w+(?:\s+|-)\w+|\w+)',
-        lambda m: str(_parse_compound_number(m.group(0), ones, teens, tens)),
-        text_lower
-    )
-    
-    # Pattern: "X hundred" alone (e.g., "two hundred")
-    text_lower = re.sub(
-        r'\b(one|two|three|four|five|six|seven|eight|nine)\s+hundred\b',
-        lambda m: str(ones.get(m.group(1), 0) * 100),
-        text_lower
-    )
-    
-    # Pattern: tens + ones (e.g., "twenty-three", "twenty three")
-    text_lower = re.sub(
-        r'\b(twenty|thirty|forty|fifty|sixty|seventy|eighty|ninety)[\s-](one|two|three|four|five|six|seven|eight|nine)\b',
-        lambda m: str(tens.get(m.group(1), 0) + ones.get(m.group(2), 0)),
-        text_lower
-    )
-    
-    # Replace single-word numbers (excluding 'hundred' and 'thousand' which are handled above)
-    all_numbers = {**ones, **teens, **tens}
-    for word, digit in all_numbers.items():
-        text_lower = re.sub(r'\b' + word + r'\b', str(digit), text_lower)
-    
-    return text_lower
+    return _words_to_digits(text.lower())
@@ -7,6 +7,7 @@ import logging
 from pathlib import Path
 import shutil
 import difflib
+from collections import OrderedDict
 import numpy as np
 
 import torch
@@ -24,7 +25,7 @@ from utils.artifact_detector import (
     extract_mfcc_profile,
     calculate_timbre_similarity
 )
-from utils.text_processor import normalize_numbers
+from utils.text_processor import normalize_numbers, fold_for_comparison
 print(f"\n[DEBUG] Python executable: {sys.executable}")
 ffmpeg_location = shutil.which("ffmpeg")
 if ffmpeg_location:
@@ -193,19 +194,50 @@ def validate_audio_signal(wav_tensor, sr):
     return True, "OK"
 
 
-from utils.text_processor import normalize_numbers
+# --- Similarity Cache ---
+# Two-level cache: reference text -> {transcript -> ratio}.
+# ASR validation compares one fixed reference chunk against many candidate
+# transcripts, so the reference is the loop invariant and gets the outer key.
+# Outer level is LRU-bounded so long-lived workers don't grow without limit.
+_SIMILARITY_CACHE_MAX_REFS = 256
+_NON_WORD_RE = re.compile(r'[\W_]+')
+_REF_CACHE = OrderedDict()
 
-def get_similarity_ratio(text1, text2):
-    # Normalize numbers first (convert "one" → "1", etc.)
-    text1 = normalize_numbers(text1)
-    text2 = normalize_numbers(text2)
-    
-    # Then remove punctuation and lowercase
-    norm1 = re.sub(r'[\W_]+', '', text1).lower()
-    norm2 = re.sub(r'[\W_]+', '', text2).lower()
+def _normalize_for_similarity(text):
+    # Unicode-fold and casefold, normalize numbers ("one" → "1", etc.),
+    # then strip punctuation (case is already folded)
+    return _NON_WORD_RE.sub('', normalize_numbers(fold_for_comparison(text)))
+
+def _compute_similarity_ratio(text1, text2):
+    norm1 = _normalize_for_similarity(text1)
+    norm2 = _normalize_for_similarity(text2)
     if not norm1 or not norm2: return 0.0
+    # SequenceMatcher is not strictly symmetric; compare in canonical order
+    # so similarity(a, b) == similarity(b, a) and mirrored cache hits are exact.
+    if norm2 < norm1:
+        norm1, norm2 = norm2, norm1
     return difflib.SequenceMatcher(None, norm1, norm2).ratio()
 
+def get_similarity_ratio(text1, text2):
+    """Cached, order-independent similarity between a reference and a transcript."""
+    sub = _REF_CACHE.get(text1)
+    if sub is None:
+        # Commutative: the pair may already be stored under the other text
+        mirrored = _REF_CACHE.get(text2)
+        if mirrored is not None and text1 in mirrored:
+            return mirrored[text1]
+        sub = _REF_CACHE[text1] = {}
+        if len(_REF_CACHE) > _SIMILARITY_CACHE_MAX_REFS:
+            _REF_CACHE.popitem(last=False)
+    else:
+        _REF_CACHE.move_to_end(text1)
+
+    ratio = sub.get(text2)
+    if ratio is None:
+        ratio = _compute_similarity_ratio(text1, text2)
+        sub[text2] = ratio
+    return ratio
+
 # apply_voice_effects removed. Logic moved to utils/pedalboard_processor.py (
 
 from core.structs import WorkerTask
@@ -511,12 +543,12 @@ def worker_process_chunk(task: WorkerTask):
             # If transcription is significantly longer than source, reject it, even if Levenshtein is high.
             
             # Normalize first to account for "1" vs "one"
-            n_trans = normalize_numbers(transcribed).lower().strip()
-            n_source = normalize_numbers(text_chunk).lower().strip()
+            n_trans = normalize_numbers(fold_for_comparison(transcribed)).strip()
+            n_source = normalize_numbers(fold_for_comparison(text_chunk)).strip()
             
             # Remove punctuation for length check
-            n_trans_clean = re.sub(r'[\W_]+', '', n_trans)
-            n_source_clean = re.sub(r'[\W_]+', '', n_source)
+            n_trans_clean = _NON_WORD_RE.sub('', n_trans)
+            n_source_clean = _NON_WORD_RE.sub('', n_source)
             
             len_t = len(n_trans_clean)
             len_s = len(n_source_clean)